@@ -9,6 +9,8 @@ setup(
     # tell setuptools that all packages will be under the 'src' directory and nowhere else
     package_dir={'': 'src'},
     install_requires=['dataclasses-json==0.6.7'],
+    # Optional faster JSON parsing / rendering.
+    extras_require={'orjson': ['orjson']},
     test_suite='tests',
     zip_safe=False,
 )
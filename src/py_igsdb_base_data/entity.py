@@ -3,7 +3,11 @@ from typing import Optional
 
 from dataclasses_json import dataclass_json
 
+from py_igsdb_base_data.serialization import fast_from_dict, fast_json
 
+
+@fast_json
+@fast_from_dict
 @dataclass_json
 @dataclass
 class BaseEntity:
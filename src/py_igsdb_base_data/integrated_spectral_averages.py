@@ -1,9 +1,11 @@
 from enum import Enum
+from typing import List
 
 
 # ENUMS
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 from py_igsdb_base_data.optical import AngularResolutionType
+from py_igsdb_base_data.optical import INCIDENCE_ANGULAR_RESOLUTION_TYPES  # noqa: F401
 
 
 class DirectDiffuseType(Enum):
@@ -28,21 +30,31 @@ class MeasurementType(Enum):
     MEASUREMENT_TYPE_RF_DIR_HEM = 'rf_dir_hem'
     MEASUREMENT_TYPE_RB_DIR_HEM = 'rb_dir_hem'
 
+    # The values listed below never change, so they're worked out
+    # once (after the class definition); each call returns a new list.
+
     @staticmethod
-    def get_types(include_tb: bool = True):
+    def get_types(include_tb: bool = True) -> List[str]:
         if include_tb:
-            return [item.value for item in MeasurementType]
+            return list(_MEASUREMENT_TYPES)
         else:
-            return [item.value for item in MeasurementType if "_TB_" not in item.name]
+            return list(_MEASUREMENT_TYPES_WITHOUT_TB)
 
     @staticmethod
-    def specular_types():
-        return [
-            MeasurementType.MEASUREMENT_TYPE_TF.value,
-            MeasurementType.MEASUREMENT_TYPE_TB.value,
-            MeasurementType.MEASUREMENT_TYPE_RF.value,
-            MeasurementType.MEASUREMENT_TYPE_RB.value,
-        ]
+    def specular_types() -> List[str]:
+        return list(_SPECULAR_MEASUREMENT_TYPES)
+
+
+_MEASUREMENT_TYPES = tuple(item.value for item in MeasurementType)
+_MEASUREMENT_TYPES_WITHOUT_TB = tuple(
+    item.value for item in MeasurementType if "_TB_" not in item.name
+)
+_SPECULAR_MEASUREMENT_TYPES = (
+    MeasurementType.MEASUREMENT_TYPE_TF.value,
+    MeasurementType.MEASUREMENT_TYPE_TB.value,
+    MeasurementType.MEASUREMENT_TYPE_RF.value,
+    MeasurementType.MEASUREMENT_TYPE_RB.value,
+)
 
 
 class ReflectionType(Enum):
@@ -84,11 +96,9 @@ class IntegratedSummaryValuesDataSource(Enum):
 # CONSTANTS and lookups
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
-
-INCIDENCE_ANGULAR_RESOLUTION_TYPES = [
-    AngularResolutionType.DIRECT,
-    AngularResolutionType.BSDF
-]
+# INCIDENCE_ANGULAR_RESOLUTION_TYPES is defined once, in the optical module,
+# and re-exported above. Note the outgoing types below are a subset of
+# optical.OUTGOING_ANGULAR_RESOLUTION_TYPES.
 
 OUTGOING_ANGULAR_RESOLUTION_TYPES = [
     AngularResolutionType.DIRECT,
@@ -14,18 +14,26 @@ class MaterialType(Enum):
     PET = "PET"
 
 
+# Material type names indexed by their (1-based) legacy integer id,
+# e.g. MATERIAL_TYPE_LOOKUP[3] == "GLASS". Index 0 is unused.
+MATERIAL_TYPE_LOOKUP = (
+    None,
+    "UNKNOWN",
+    "NA",
+    "GLASS",
+    "PVB",
+    "POLYCARBONATE",
+    "ACRYLIC",
+    "PET",
+)
+
+# Kept for callers that use dict semantics, e.g. material_type_lookup.get(id)
 material_type_lookup = {
-    1: "UNKNOWN",
-    2: "NA",
-    3: "GLASS",
-    4: "PVB",
-    5: "POLYCARBONATE",
-    6: "ACRYLIC",
-    7: "PET"
+    index: name for index, name in enumerate(MATERIAL_TYPE_LOOKUP) if name is not None
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class MaterialBulkProperties:
     name: Optional[str] = None
     display_name: Optional[str] = None
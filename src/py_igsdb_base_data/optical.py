@@ -1,9 +1,12 @@
 import typing
 from dataclasses import dataclass, field
 from enum import Enum
+from operator import attrgetter, itemgetter
 from typing import Dict, Optional
 
-from dataclasses_json import dataclass_json
+from dataclasses_json import config, dataclass_json
+
+from py_igsdb_base_data.serialization import fast_from_dict, fast_json
 
 
 class OpticalDataType(Enum):
@@ -31,7 +34,7 @@ OUTGOING_ANGULAR_RESOLUTION_TYPES = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class WavelengthMeasurement:
     tf: Optional[float] = None
     tb: Optional[float] = None
@@ -39,15 +42,33 @@ class WavelengthMeasurement:
     rb: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WavelengthMeasurementSet:
     w: float = 0
     specular: Optional[WavelengthMeasurement] = None
     diffuse: Optional[WavelengthMeasurement] = None
 
 
+# Wavelengths (in micrometers) at or above this value are thermal IR wavelengths.
+THERMAL_IR_MIN_WAVELENGTH = 25.0
+
+_get_wavelength = itemgetter("w")
+
+
+def _decode_wavelength_data(wavelength_data: typing.List[dict]) -> typing.List[dict]:
+    # The wavelength dictionaries are plain JSON data, so there is nothing
+    # to convert. Left to itself, dataclasses_json would rebuild every row
+    # (and its nested 'specular' / 'diffuse' dictionaries) one value at a
+    # time, which dominates the time taken to load a product. Instead we
+    # make a shallow copy of each row, so instances loaded from the same
+    # data don't share (and can't edit each other's) rows.
+    return [dict(row) for row in wavelength_data]
+
+
+@fast_json(native=True)
+@fast_from_dict
 @dataclass_json
-@dataclass
+@dataclass(slots=True)
 class AngleBlock:
     incidence_angle: int = 0
     num_wavelengths: int = 0
@@ -60,18 +81,25 @@ class AngleBlock:
     # ...so we don't use a typed list like this:
     # wavelength_data: typing.List[WavelengthMeasurementSet] = field(default_factory=list)
 
-    wavelength_data: typing.List[dict] = field(default_factory=list)
+    wavelength_data: typing.List[dict] = field(
+        default_factory=list,
+        metadata=config(decoder=_decode_wavelength_data),
+    )
 
 
+@fast_json(native=True)
+@fast_from_dict
 @dataclass_json
-@dataclass
+@dataclass(slots=True)
 class OpticalData:
     number_incidence_angles: Optional[int] = None
     angle_blocks: typing.List[AngleBlock] = field(default_factory=list)
 
 
+@fast_json(native=True)
+@fast_from_dict
 @dataclass_json
-@dataclass
+@dataclass(slots=True)
 class OpticalProperties:
     optical_data_type: str = OpticalDataType.DISCRETE.name
 
@@ -95,15 +123,30 @@ class OpticalProperties:
         """
         if not self.optical_data:
             return False
-        for angle_block in self.optical_data.angle_blocks:
-            for w_data in angle_block.wavelength_data:
-                w = float(w_data["w"])
-                if w >= 25.0:
-                    return True
+        angle_blocks = self.optical_data.angle_blocks
+        # Wavelength data is normally in ascending order, so when a product
+        # has thermal IR data the last wavelength of a block will usually
+        # tell us without scanning the whole block.
+        for angle_block in angle_blocks:
+            if (
+                angle_block.wavelength_data
+                and float(angle_block.wavelength_data[-1]["w"]) >= THERMAL_IR_MIN_WAVELENGTH
+            ):
+                return True
+        # Order isn't guaranteed, so check every wavelength before saying no.
+        for angle_block in angle_blocks:
+            # Reduce each block to its longest wavelength with map()/max(),
+            # which keeps the loop over the wavelengths in C.
+            longest_wavelength = max(
+                map(float, map(_get_wavelength, angle_block.wavelength_data)),
+                default=0.0,
+            )
+            if longest_wavelength >= THERMAL_IR_MIN_WAVELENGTH:
+                return True
         return False
 
 
-@dataclass
+@dataclass(slots=True)
 class OpticalStandardMethodFluxResults:
     direct_direct: Optional[float] = None  # "Specular" in CGDB ShadeMaterial
     direct_diffuse: Optional[float] = None  # "Diffuse" in CGDB ShadeMaterial
@@ -112,7 +155,7 @@ class OpticalStandardMethodFluxResults:
     matrix: Optional[typing.List[typing.List[float]]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OpticalStandardMethodResults:
     transmittance_front: OpticalStandardMethodFluxResults = None
     transmittance_back: OpticalStandardMethodFluxResults = None
@@ -125,7 +168,7 @@ class OpticalStandardMethodResults:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ThermalIRResults:
     transmittance_front_diffuse_diffuse: Optional[float] = None
     transmittance_back_diffuse_diffuse: Optional[float] = None
@@ -133,67 +176,56 @@ class ThermalIRResults:
     emissivity_front_hemispheric: Optional[float] = None
     emissivity_back_hemispheric: Optional[float] = None
 
-    error = None
-
-    # Shortcut properties...
-    @property
-    def absorptance_front_hemispheric(self) -> Optional[float]:
-        if self.emissivity_front_hemispheric:
-            return self.emissivity_front_hemispheric
-        else:
-            return None
-
-    @property
-    def absorptance_back_hemispheric(self) -> Optional[float]:
-        if self.emissivity_back_hemispheric:
-            return self.emissivity_back_hemispheric
-        else:
-            return None
-
-    @property
-    def transmittance_front(self) -> Optional[float]:
-        if self.transmittance_front_diffuse_diffuse:
-            return self.transmittance_front_diffuse_diffuse
-        else:
-            return None
-
-    @property
-    def transmittance_back(self) -> Optional[float]:
-        if self.transmittance_back_diffuse_diffuse:
-            return self.transmittance_back_diffuse_diffuse
-        else:
-            return None
-
+    error: Optional[str] = None
 
-@dataclass
+    # Shortcut properties. These are read-only aliases of the fields above.
+    absorptance_front_hemispheric = property(
+        attrgetter("emissivity_front_hemispheric"),
+        doc="Alias of emissivity_front_hemispheric",
+    )
+    absorptance_back_hemispheric = property(
+        attrgetter("emissivity_back_hemispheric"),
+        doc="Alias of emissivity_back_hemispheric",
+    )
+    transmittance_front = property(
+        attrgetter("transmittance_front_diffuse_diffuse"),
+        doc="Alias of transmittance_front_diffuse_diffuse",
+    )
+    transmittance_back = property(
+        attrgetter("transmittance_back_diffuse_diffuse"),
+        doc="Alias of transmittance_back_diffuse_diffuse",
+    )
+
+
+@dataclass(slots=True)
 class TrichromaticResult:
     x: Optional[float] = None
     y: Optional[float] = None
     z: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LabResult:
     l: Optional[float] = None
     a: Optional[float] = None
     b: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RGBResult:
     r: Optional[float] = None
     g: Optional[float] = None
     b: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OpticalColorResult:
     trichromatic: Optional[TrichromaticResult] = None
     lab: Optional[LabResult] = None
     rgb: Optional[RGBResult] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OpticalColorFluxResults:
     direct_direct: Optional[OpticalColorResult] = None
     direct_diffuse: Optional[OpticalColorResult] = None
@@ -201,13 +233,13 @@ class OpticalColorFluxResults:
     diffuse_diffuse: Optional[OpticalColorResult] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OpticalColorResults:
     transmittance_front: Optional[OpticalColorFluxResults] = None
     transmittance_back: Optional[OpticalColorFluxResults] = None
     reflectance_front: Optional[OpticalColorFluxResults] = None
     reflectance_back: Optional[OpticalColorFluxResults] = None
-    error = None
+    error: Optional[str] = None
 
 
 class OpticalStandardMethodResultsFactory:
@@ -216,22 +248,22 @@ class OpticalStandardMethodResultsFactory:
         """
         Create a fully initialized instance of OpticalStandardMethodResults
         """
-        results = OpticalStandardMethodResults()
-        results.transmittance_front = OpticalStandardMethodFluxResults()
-        results.transmittance_back = OpticalStandardMethodFluxResults()
-        results.reflectance_front = OpticalStandardMethodFluxResults()
-        results.reflectance_back = OpticalStandardMethodFluxResults()
-        return results
+        return OpticalStandardMethodResults(
+            transmittance_front=OpticalStandardMethodFluxResults(),
+            transmittance_back=OpticalStandardMethodFluxResults(),
+            reflectance_front=OpticalStandardMethodFluxResults(),
+            reflectance_back=OpticalStandardMethodFluxResults(),
+        )
 
 
 class OpticalColorResultFactory:
     @classmethod
     def create(cls) -> OpticalColorResult:
-        result = OpticalColorResult()
-        result.trichromatic = TrichromaticResult()
-        result.rgb = RGBResult()
-        result.lab = LabResult()
-        return result
+        return OpticalColorResult(
+            trichromatic=TrichromaticResult(),
+            lab=LabResult(),
+            rgb=RGBResult(),
+        )
 
 
 class OpticalColorResultsFactory:
@@ -240,12 +272,12 @@ class OpticalColorResultsFactory:
         """
         Create a fully initialized instance of OpticalColorResult
         """
-        results = OpticalColorResults()
-        results.transmittance_front = OpticalColorFluxResultsFactory.create()
-        results.transmittance_back = OpticalColorFluxResultsFactory.create()
-        results.reflectance_front = OpticalColorFluxResultsFactory.create()
-        results.reflectance_back = OpticalColorFluxResultsFactory.create()
-        return results
+        return OpticalColorResults(
+            transmittance_front=OpticalColorFluxResultsFactory.create(),
+            transmittance_back=OpticalColorFluxResultsFactory.create(),
+            reflectance_front=OpticalColorFluxResultsFactory.create(),
+            reflectance_back=OpticalColorFluxResultsFactory.create(),
+        )
 
 
 class OpticalColorFluxResultsFactory:
@@ -254,18 +286,74 @@ class OpticalColorFluxResultsFactory:
         """
         Create a fully initialized instance of OpticalColorResult
         """
-        results = OpticalColorFluxResults()
-
-        results.direct_direct = OpticalColorResultFactory.create()
-        results.direct_diffuse = OpticalColorResultFactory.create()
-        results.direct_hemispherical = OpticalColorResultFactory.create()
-        results.diffuse_diffuse = OpticalColorResultFactory.create()
-
-        return results
-
-
+        return OpticalColorFluxResults(
+            direct_direct=OpticalColorResultFactory.create(),
+            direct_diffuse=OpticalColorResultFactory.create(),
+            direct_hemispherical=OpticalColorResultFactory.create(),
+            diffuse_diffuse=OpticalColorResultFactory.create(),
+        )
+
+
+# Dotted attribute paths for the convenience getters on
+# IntegratedSpectralAveragesSummaryValues, in the order used by flatten().
+SUMMARY_VALUE_PATHS: Dict[str, str] = {
+    "tf_sol": "solar.transmittance_front.direct_direct",
+    "tf_sol_dir_dif": "solar.transmittance_front.direct_diffuse",
+    "tf_sol_dir_hem": "solar.transmittance_front.direct_hemispherical",
+    "tb_sol": "solar.transmittance_back.direct_direct",
+    "tb_sol_dir_dif": "solar.transmittance_back.direct_diffuse",
+    "tb_sol_dir_hem": "solar.transmittance_back.direct_hemispherical",
+    "rf_sol": "solar.reflectance_front.direct_direct",
+    "rf_sol_dir_dif": "solar.reflectance_front.direct_diffuse",
+    "rf_sol_dir_hem": "solar.reflectance_front.direct_hemispherical",
+    "rb_sol": "solar.reflectance_back.direct_direct",
+    "rb_sol_dir_dif": "solar.reflectance_back.direct_diffuse",
+    "rb_sol_dir_hem": "solar.reflectance_back.direct_hemispherical",
+    "tf_vis": "photopic.transmittance_front.direct_direct",
+    "tf_vis_dir_dif": "photopic.transmittance_front.direct_diffuse",
+    "tf_vis_dir_hem": "photopic.transmittance_front.direct_hemispherical",
+    "tb_vis": "photopic.transmittance_back.direct_direct",
+    "tb_vis_dir_dif": "photopic.transmittance_back.direct_diffuse",
+    "tb_vis_dir_hem": "photopic.transmittance_back.direct_hemispherical",
+    "rf_vis": "photopic.reflectance_front.direct_direct",
+    "rf_vis_dir_dif": "photopic.reflectance_front.direct_diffuse",
+    "rf_vis_dir_hem": "photopic.reflectance_front.direct_hemispherical",
+    "rb_vis": "photopic.reflectance_back.direct_direct",
+    "rb_vis_dir_dif": "photopic.reflectance_back.direct_diffuse",
+    "rb_vis_dir_hem": "photopic.reflectance_back.direct_hemispherical",
+    "tf_tuv": "tuv.transmittance_front.direct_direct",
+    "tf_spf": "spf.transmittance_front.direct_direct",
+    "tf_tdw": "tdw.transmittance_front.direct_direct",
+    "tf_tkr": "tkr.transmittance_front.direct_direct",
+    "tf_ciex": "color.transmittance_front.direct_direct.trichromatic.x",
+    "tf_ciey": "color.transmittance_front.direct_direct.trichromatic.y",
+    "tf_ciez": "color.transmittance_front.direct_direct.trichromatic.z",
+    "rf_ciex": "color.reflectance_front.direct_direct.trichromatic.x",
+    "rf_ciey": "color.reflectance_front.direct_direct.trichromatic.y",
+    "rf_ciez": "color.reflectance_front.direct_direct.trichromatic.z",
+    "rb_ciex": "color.reflectance_back.direct_direct.trichromatic.x",
+    "rb_ciey": "color.reflectance_back.direct_direct.trichromatic.y",
+    "rb_ciez": "color.reflectance_back.direct_direct.trichromatic.z",
+    "tf_r": "color.transmittance_front.direct_direct.rgb.r",
+    "tf_b": "color.transmittance_front.direct_direct.rgb.b",
+    "tf_g": "color.transmittance_front.direct_direct.rgb.g",
+    "rf_r": "color.reflectance_front.direct_direct.rgb.r",
+    "rf_b": "color.reflectance_front.direct_direct.rgb.b",
+    "rf_g": "color.reflectance_front.direct_direct.rgb.g",
+    "rb_r": "color.reflectance_back.direct_direct.rgb.r",
+    "rb_b": "color.reflectance_back.direct_direct.rgb.b",
+    "rb_g": "color.reflectance_back.direct_direct.rgb.g",
+    "tir_front": "thermal_ir.transmittance_front_diffuse_diffuse",
+    "tir_back": "thermal_ir.transmittance_back_diffuse_diffuse",
+    "emissivity_front": "thermal_ir.emissivity_front_hemispheric",
+    "emissivity_back": "thermal_ir.emissivity_back_hemispheric",
+}
+
+
+@fast_json(native=True)
+@fast_from_dict
 @dataclass_json
-@dataclass
+@dataclass(slots=True)
 class IntegratedSpectralAveragesSummaryValues:
     solar: Optional[OpticalStandardMethodResults] = None
     photopic: Optional[OpticalStandardMethodResults] = None
@@ -276,441 +364,158 @@ class IntegratedSpectralAveragesSummaryValues:
     tkr: Optional[OpticalStandardMethodResults] = None
     color: Optional[OpticalColorResults] = None
 
-    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-    # Convenience getters
-    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-
-    @property
-    def tf_sol(self):
-        try:
-            return self.solar.transmittance_front.direct_direct
-        except AttributeError:
-            return None
-
-    @property
-    def tf_sol_dir_dif(self):
-        try:
-            return self.solar.transmittance_front.direct_diffuse
-        except AttributeError:
-            return None
-
-    @property
-    def tf_sol_dir_hem(self):
-        try:
-            return self.solar.transmittance_front.direct_hemispherical
-        except AttributeError:
-            return None
-
-    @property
-    def tb_sol(self):
-        try:
-            return self.solar.transmittance_back.direct_direct
-        except AttributeError:
-            return None
-
-    @property
-    def tb_sol_dir_dif(self):
-        try:
-            return self.solar.transmittance_back.direct_diffuse
-        except AttributeError:
-            return None
-
-    @property
-    def tb_sol_dir_hem(self):
-        try:
-            return self.solar.transmittance_back.direct_hemispherical
-        except AttributeError:
-            return None
-
-    @property
-    def rf_sol(self):
-        try:
-            return self.solar.reflectance_front.direct_direct
-        except AttributeError:
-            return None
-
-    @property
-    def rf_sol_dir_dif(self):
-        try:
-            return self.solar.reflectance_front.direct_diffuse
-        except AttributeError:
-            return None
-
-    @property
-    def rf_sol_dir_hem(self):
-        try:
-            return self.solar.reflectance_front.direct_hemispherical
-        except AttributeError:
-            return None
-
-    @property
-    def rb_sol(self):
-        try:
-            return self.solar.reflectance_back.direct_direct
-        except AttributeError:
-            return None
-
-    @property
-    def rb_sol_dir_dif(self):
-        try:
-            return self.solar.reflectance_back.direct_diffuse
-        except AttributeError:
-            return None
-
-    @property
-    def rb_sol_dir_hem(self):
-        try:
-            return self.solar.reflectance_back.direct_hemispherical
-        except AttributeError:
-            return None
-
-    @property
-    def tf_vis(self):
-        try:
-            return self.photopic.transmittance_front.direct_direct
-        except AttributeError:
-            return None
-
-    @property
-    def tf_vis_dir_dif(self):
-        try:
-            return self.photopic.transmittance_front.direct_diffuse
-        except AttributeError:
-            return None
-
-    @property
-    def tf_vis_dir_hem(self):
-        try:
-            return self.photopic.transmittance_front.direct_hemispherical
-        except AttributeError:
-            return None
-
-    @property
-    def tb_vis(self):
-        try:
-            return self.photopic.transmittance_back.direct_direct
-        except AttributeError:
-            return None
-
-    @property
-    def tb_vis_dir_dif(self):
-        try:
-            return self.photopic.transmittance_back.direct_diffuse
-        except AttributeError:
-            return None
-
-    @property
-    def tb_vis_dir_hem(self):
-        try:
-            return self.photopic.transmittance_back.direct_hemispherical
-        except AttributeError:
-            return None
-
-    @property
-    def rf_vis(self):
-        try:
-            return self.photopic.reflectance_front.direct_direct
-        except AttributeError:
-            return None
-
-    @property
-    def rf_vis_dir_dif(self):
-        try:
-            return self.photopic.reflectance_front.direct_diffuse
-        except AttributeError:
-            return None
-
-    @property
-    def rf_vis_dir_hem(self):
-        try:
-            return self.photopic.reflectance_front.direct_hemispherical
-        except AttributeError:
-            return None
-
-    @property
-    def rb_vis(self):
-        try:
-            return self.photopic.reflectance_back.direct_direct
-        except AttributeError:
-            return None
-
-    @property
-    def rb_vis_dir_dif(self):
-        try:
-            return self.photopic.reflectance_back.direct_diffuse
-        except AttributeError:
-            return None
-
-    @property
-    def rb_vis_dir_hem(self):
-        try:
-            return self.photopic.reflectance_back.direct_hemispherical
-        except AttributeError:
-            return None
-
-    @property
-    def tf_tuv(self):
-        try:
-            return self.tuv.transmittance_front.direct_direct
-        except AttributeError:
-            return None
-
-    @property
-    def tf_spf(self):
-        try:
-            return self.spf.transmittance_front.direct_direct
-        except AttributeError:
-            return None
-
-    @property
-    def tf_tdw(self):
-        try:
-            return self.tdw.transmittance_front.direct_direct
-        except AttributeError:
-            return None
-
-    @property
-    def tf_tkr(self):
-        try:
-            return self.tkr.transmittance_front.direct_direct
-        except AttributeError:
-            return None
-
-    @property
-    def tf_ciex(self):
-        try:
-            return self.color.transmittance_front.direct_direct.trichromatic.x
-        except AttributeError:
-            return None
-
-    @property
-    def tf_ciey(self):
-        try:
-            return self.color.transmittance_front.direct_direct.trichromatic.y
-        except AttributeError:
-            return None
-
-    @property
-    def tf_ciez(self):
-        try:
-            return self.color.transmittance_front.direct_direct.trichromatic.z
-        except AttributeError:
-            return None
-
-    @property
-    def rf_ciex(self):
-        try:
-            return self.color.reflectance_front.direct_direct.trichromatic.x
-        except AttributeError:
-            return None
-
-    @property
-    def rf_ciey(self):
-        try:
-            return self.color.reflectance_front.direct_direct.trichromatic.y
-        except AttributeError:
-            return None
-
-    @property
-    def rf_ciez(self):
-        try:
-            return self.color.reflectance_front.direct_direct.trichromatic.z
-        except AttributeError:
-            return None
-
-    @property
-    def rb_ciex(self):
-        try:
-            return self.color.reflectance_back.direct_direct.trichromatic.x
-        except AttributeError:
-            return None
-
-    @property
-    def rb_ciey(self):
-        try:
-            return self.color.reflectance_back.direct_direct.trichromatic.y
-        except AttributeError:
-            return None
-
-    @property
-    def rb_ciez(self):
-        try:
-            return self.color.reflectance_back.direct_direct.trichromatic.z
-        except AttributeError:
-            return None
-
-    @property
-    def tf_r(self):
-        try:
-            return self.color.transmittance_front.direct_direct.rgb.r
-        except AttributeError:
-            return None
-
-    @property
-    def tf_b(self):
-        try:
-            return self.color.transmittance_front.direct_direct.rgb.b
-        except AttributeError:
-            return None
-
-    @property
-    def tf_g(self):
-        try:
-            return self.color.transmittance_front.direct_direct.rgb.g
-        except AttributeError:
-            return None
-
-    @property
-    def rf_r(self):
-        try:
-            return self.color.reflectance_front.direct_direct.rgb.r
-        except AttributeError:
-            return None
-
-    @property
-    def rf_b(self):
-        try:
-            return self.color.reflectance_front.direct_direct.rgb.b
-        except AttributeError:
-            return None
-
-    @property
-    def rf_g(self):
-        try:
-            return self.color.reflectance_front.direct_direct.rgb.g
-        except AttributeError:
-            return None
-
-    @property
-    def rb_r(self):
-        try:
-            return self.color.reflectance_back.direct_direct.rgb.r
-        except AttributeError:
-            return None
-
-    @property
-    def rb_b(self):
-        try:
-            return self.color.reflectance_back.direct_direct.rgb.b
-        except AttributeError:
-            return None
-
-    @property
-    def rb_g(self):
-        try:
-            return self.color.reflectance_back.direct_direct.rgb.g
-        except AttributeError:
-            return None
-
-    @property
-    def tir_front(self) -> Optional[str]:
-        """
-        Returns the front TIR.
-
-        Returns:
-
-        """
-        try:
-            return self.thermal_ir.transmittance_front
-        except AttributeError:
-            return None
-
-    @property
-    def tir_back(self) -> Optional[str]:
+    def ensure_results(self, name: str):
         """
-        Returns the back TIR.
+        Returns the results for one part of the summary (e.g. "solar",
+        "thermal_ir" or "color"), first creating fully initialized results
+        for that part only if it isn't defined yet.
 
-        Returns:
+        Use this instead of IntegratedSpectralAveragesSummaryValuesFactory.create()
+        when only some parts of the summary will be populated, e.g.
 
+            summary = IntegratedSpectralAveragesSummaryValues()
+            summary.ensure_results("solar").transmittance_front.direct_direct = 0.5
         """
         try:
-            return self.thermal_ir.transmittance_back
-        except AttributeError:
-            return None
+            factory = _SUMMARY_RESULTS_FACTORIES[name]
+        except KeyError:
+            raise ValueError(f"Unknown summary results: {name}")
+        results = getattr(self, name)
+        if results is None:
+            results = factory()
+            setattr(self, name, results)
+        return results
 
-    @property
-    def emissivity_front(self) -> Optional[str]:
+    def get_value(self, name: str) -> Optional[float]:
         """
-        Returns the front emissivity.
+        Returns a summary value by its convenience getter name
+        (a key of SUMMARY_VALUE_PATHS), e.g. get_value("tf_sol").
 
         Returns:
-
+            The value, or None if that part of the summary is not defined.
         """
         try:
-            return self.thermal_ir.emissivity_front_hemispheric
-        except AttributeError:
-            return None
+            getter = _SUMMARY_VALUE_GETTERS[name]
+        except KeyError:
+            raise ValueError(f"Unknown summary value: {name}")
+        return getter(self)
 
-    @property
-    def emissivity_back(self) -> Optional[str]:
+    def set_value(self, name: str, value: Optional[float]) -> None:
         """
-        Returns the back emissivity.
-
-        Returns:
+        Sets a summary value by its convenience getter name
+        (a key of SUMMARY_VALUE_PATHS), e.g. set_value("tf_sol", 0.5).
 
+        Only the results along the path to that value are created (if
+        they aren't defined yet), so a summary populated this way holds
+        just the objects it needs, unlike one created by
+        IntegratedSpectralAveragesSummaryValuesFactory.create().
         """
         try:
-            return self.thermal_ir.emissivity_back_hemispheric
-        except AttributeError:
-            return None
+            setter = _SUMMARY_VALUE_SETTERS[name]
+        except KeyError:
+            raise ValueError(f"Unknown summary value: {name}")
+        setter(self, value)
 
     def flatten(self) -> Dict:
         """
         Flatten the summary data to a dictionary.
         """
-        data = {
-            "tf_sol": self.tf_sol,
-            "tf_sol_dir_dif": self.tf_sol_dir_dif,
-            "tf_sol_dir_hem": self.tf_sol_dir_hem,
-            "tb_sol": self.tb_sol,
-            "tb_sol_dir_dif": self.tb_sol_dir_dif,
-            "tb_sol_dir_hem": self.tb_sol_dir_hem,
-            "rf_sol": self.rf_sol,
-            "rf_sol_dir_dif": self.rf_sol_dir_dif,
-            "rf_sol_dir_hem": self.rf_sol_dir_hem,
-            "rb_sol": self.rb_sol,
-            "rb_sol_dir_dif": self.rb_sol_dir_dif,
-            "rb_sol_dir_hem": self.rb_sol_dir_hem,
-            "tf_vis": self.tf_vis,
-            "tf_vis_dir_dif": self.tf_vis_dir_dif,
-            "tf_vis_dir_hem": self.tf_vis_dir_hem,
-            "tb_vis": self.tb_vis,
-            "tb_vis_dir_dif": self.tb_vis_dir_dif,
-            "tb_vis_dir_hem": self.tb_vis_dir_hem,
-            "rf_vis": self.rf_vis,
-            "rf_vis_dir_dif": self.rf_vis_dir_dif,
-            "rf_vis_dir_hem": self.rf_vis_dir_hem,
-            "rb_vis": self.rb_vis,
-            "rb_vis_dir_dif": self.rb_vis_dir_dif,
-            "rb_vis_dir_hem": self.rb_vis_dir_hem,
-            "tf_tuv": self.tf_tuv,
-            "tf_spf": self.tf_spf,
-            "tf_tdw": self.tf_tdw,
-            "tf_tkr": self.tf_tkr,
-            "tf_ciex": self.tf_ciex,
-            "tf_ciey": self.tf_ciey,
-            "tf_ciez": self.tf_ciez,
-            "rf_ciex": self.rf_ciex,
-            "rf_ciey": self.rf_ciey,
-            "rf_ciez": self.rf_ciez,
-            "rb_ciex": self.rb_ciex,
-            "rb_ciey": self.rb_ciey,
-            "rb_ciez": self.rb_ciez,
-            "tf_r": self.tf_r,
-            "tf_b": self.tf_b,
-            "tf_g": self.tf_g,
-            "rf_r": self.rf_r,
-            "rf_b": self.rf_b,
-            "rf_g": self.rf_g,
-            "rb_r": self.rb_r,
-            "rb_b": self.rb_b,
-            "rb_g": self.rb_g,
-            "tir_front": self.tir_front,
-            "tir_back": self.tir_back,
-            "emissivity_front": self.emissivity_front,
-            "emissivity_back": self.emissivity_back,
-        }
-        return data
+        return {name: getter(self) for name, getter in _SUMMARY_VALUE_GETTERS.items()}
+
+
+def _make_summary_value_getter(path: str) -> typing.Callable:
+    # Generate a getter with the attribute walk written out, checking for
+    # a missing (None) branch at each step, e.g. for "solar.transmittance_front.direct_direct":
+    #
+    #     def get_value(self):
+    #         value = self
+    #         value = value.solar
+    #         if value is None:
+    #             return None
+    #         value = value.transmittance_front
+    #         if value is None:
+    #             return None
+    #         return value.direct_direct
+    #
+    # Summaries are often only partially populated, and checking for None
+    # is much cheaper than raising and catching an AttributeError. Writing
+    # the walk out (rather than looping over the attribute names) lets the
+    # interpreter specialize each attribute access.
+    attribute_names = path.split(".")
+    if not all(name.isidentifier() for name in attribute_names):
+        raise ValueError(f"Invalid summary value path: {path}")
+    lines = ["def get_value(self):", "    value = self"]
+    for attribute_name in attribute_names[:-1]:
+        lines.append(f"    value = value.{attribute_name}")
+        lines.append("    if value is None:")
+        lines.append("        return None")
+    lines.append(f"    return value.{attribute_names[-1]}")
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["get_value"]
+
+
+# Getter functions for each summary value, built once. Used by
+# get_value() and flatten() to skip the property lookup.
+_SUMMARY_VALUE_GETTERS: Dict[str, typing.Callable] = {
+    name: _make_summary_value_getter(path) for name, path in SUMMARY_VALUE_PATHS.items()
+}
+
+
+def _make_summary_value_setter(path: str) -> typing.Callable:
+    # Look up (once) the class of each intermediate result on the path,
+    # so missing results can be created on the way down.
+    attribute_names = tuple(path.split("."))
+    steps = []
+    owner = IntegratedSpectralAveragesSummaryValues
+    for attribute_name in attribute_names[:-1]:
+        result_class = typing.get_type_hints(owner)[attribute_name]
+        if typing.get_origin(result_class) is typing.Union:
+            # Optional[X]
+            result_class = typing.get_args(result_class)[0]
+        steps.append((attribute_name, result_class))
+        owner = result_class
+    last_attribute_name = attribute_names[-1]
+
+    def set_value(self, value):
+        results = self
+        for attribute_name, result_class in steps:
+            child = getattr(results, attribute_name)
+            if child is None:
+                child = result_class()
+                setattr(results, attribute_name, child)
+            results = child
+        setattr(results, last_attribute_name, value)
+
+    return set_value
+
+
+_SUMMARY_VALUE_SETTERS: Dict[str, typing.Callable] = {
+    name: _make_summary_value_setter(path) for name, path in SUMMARY_VALUE_PATHS.items()
+}
+
+# Add a read-only convenience getter to IntegratedSpectralAveragesSummaryValues
+# for each entry in SUMMARY_VALUE_PATHS, e.g. summary.tf_sol.
+for _name, _getter in _SUMMARY_VALUE_GETTERS.items():
+    setattr(
+        IntegratedSpectralAveragesSummaryValues,
+        _name,
+        property(_getter, doc=f"Shortcut to {SUMMARY_VALUE_PATHS[_name]}"),
+    )
+del _name, _getter
+
+
+# How to create each part of a summary, for ensure_results().
+_SUMMARY_RESULTS_FACTORIES: Dict[str, typing.Callable] = {
+    "solar": OpticalStandardMethodResultsFactory.create,
+    "photopic": OpticalStandardMethodResultsFactory.create,
+    "thermal_ir": ThermalIRResults,
+    "tuv": OpticalStandardMethodResultsFactory.create,
+    "spf": OpticalStandardMethodResultsFactory.create,
+    "tdw": OpticalStandardMethodResultsFactory.create,
+    "tkr": OpticalStandardMethodResultsFactory.create,
+    "color": OpticalColorResultsFactory.create,
+}
 
 
 class IntegratedSpectralAveragesSummaryValuesFactory:
@@ -719,14 +524,13 @@ class IntegratedSpectralAveragesSummaryValuesFactory:
         """
         Create a fully initialized instance of IntegratedSpectralAveragesSummaryValues
         """
-
-        summary = IntegratedSpectralAveragesSummaryValues()
-        summary.solar = OpticalStandardMethodResultsFactory.create()
-        summary.photopic = OpticalStandardMethodResultsFactory.create()
-        summary.thermal_ir = ThermalIRResults()
-        summary.tuv = OpticalStandardMethodResultsFactory.create()
-        summary.spf = OpticalStandardMethodResultsFactory.create()
-        summary.tdw = OpticalStandardMethodResultsFactory.create()
-        summary.tkr = OpticalStandardMethodResultsFactory.create()
-        summary.color = OpticalColorResultsFactory.create()
-        return summary
+        return IntegratedSpectralAveragesSummaryValues(
+            solar=OpticalStandardMethodResultsFactory.create(),
+            photopic=OpticalStandardMethodResultsFactory.create(),
+            thermal_ir=ThermalIRResults(),
+            tuv=OpticalStandardMethodResultsFactory.create(),
+            spf=OpticalStandardMethodResultsFactory.create(),
+            tdw=OpticalStandardMethodResultsFactory.create(),
+            tkr=OpticalStandardMethodResultsFactory.create(),
+            color=OpticalColorResultsFactory.create(),
+        )
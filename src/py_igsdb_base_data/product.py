@@ -1,10 +1,13 @@
 import logging
+import os
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
+from functools import lru_cache
 from math import sqrt
-from typing import List, Dict
+from operator import attrgetter
+from typing import Callable, List, Dict, Union
 from typing import Optional
 
 from dataclasses_json import dataclass_json
@@ -12,6 +15,7 @@ from dataclasses_json import dataclass_json
 from py_igsdb_base_data.material import MaterialBulkProperties
 from py_igsdb_base_data.optical import IntegratedSpectralAveragesSummaryValues
 from py_igsdb_base_data.optical import OpticalProperties
+from py_igsdb_base_data.serialization import fast_from_dict, fast_json, fast_to_dict, loads
 
 logger = logging.getLogger(__name__)
 
@@ -55,7 +59,12 @@ class TokenType(Enum):
 
     def igsdb_types(self) -> List[str]:
         # These types can appear in the IGSDB
-        return [TokenType.PUBLISHED.name, TokenType.UNDEFINED.name]
+        return list(IGSDB_TOKEN_TYPE_NAMES)
+
+
+# Names of the token types that can appear in the IGSDB,
+# e.g. token_type in IGSDB_TOKEN_TYPE_NAMES
+IGSDB_TOKEN_TYPE_NAMES = (TokenType.PUBLISHED.name, TokenType.UNDEFINED.name)
 
 
 class ProductType(Enum):
@@ -158,8 +167,9 @@ GLAZING_SUBTYPES = [
 
 GLAZING_SUBTYPE_NAMES = [item.name for item in GLAZING_SUBTYPES]
 
-SHADING_SUBTYPES = [
-    # 'ShadingLayer' subtypes...
+# Subset of shading subtypes.
+# These will have a composition layer.
+SHADING_LAYER_SUBTYPES = [
     ProductSubtype.VENETIAN_BLIND,
     ProductSubtype.DIFFUSING_SHADE,
     ProductSubtype.ROLLER_SHADE,
@@ -169,6 +179,11 @@ SHADING_SUBTYPES = [
     ProductSubtype.CELLULAR_SHADE,
     ProductSubtype.PLEATED_SHADE,
     ProductSubtype.ROMAN_SHADE,
+]
+
+SHADING_SUBTYPES = [
+    # 'ShadingLayer' subtypes...
+    *SHADING_LAYER_SUBTYPES,
     # 'ShadeMaterial' subtypes
     ProductSubtype.SHADE_MATERIAL,
     # Diffusing hybrids
@@ -178,20 +193,6 @@ SHADING_SUBTYPES = [
     ProductSubtype.CHROMOGENIC,
 ]
 
-# Subset of shading subtypes.
-# These will have a composition layer.
-SHADING_LAYER_SUBTYPES = [
-    ProductSubtype.VENETIAN_BLIND,
-    ProductSubtype.DIFFUSING_SHADE,
-    ProductSubtype.ROLLER_SHADE,
-    ProductSubtype.WOVEN_SHADE,
-    ProductSubtype.VERTICAL_LOUVER,
-    ProductSubtype.PERFORATED_SCREEN,
-    ProductSubtype.CELLULAR_SHADE,
-    ProductSubtype.PLEATED_SHADE,
-    ProductSubtype.ROMAN_SHADE,
-]
-
 """
 Historical Note: 
 In the old CGDB database:
@@ -217,17 +218,38 @@ CGDB to IGSDB, when we see 7 we assume CELLULAR_SHADE, unless
 
 SHADING_SUBTYPE_NAMES = [item.name for item in SHADING_SUBTYPES]
 
+# Valid names for the BaseProduct type, subtype and token_type setters.
+# Each name maps to the enum's own (interned) copy of the string, which the
+# setters store instead of the string they were given (e.g. a new string
+# decoded from JSON). Later comparisons against the enum names, such as
+# subtype == ProductSubtype.LAMINATE.name, then succeed on identity.
+_PRODUCT_TYPE_NAMES = {name: name for name in ProductType.__members__}
+_PRODUCT_SUBTYPE_NAMES = {name: name for name in ProductSubtype.__members__}
+_TOKEN_TYPE_NAMES = {name: name for name in TokenType.__members__}
+
+# Type and subtype names used by BaseProduct checks, looked up once.
+_GLAZING_NAME = ProductType.GLAZING.name
+_MONOLITHIC_NAME = ProductSubtype.MONOLITHIC.name
+_LAMINATE_NAME = ProductSubtype.LAMINATE.name
+_COATED_NAME = ProductSubtype.COATED.name
+
+# Only MONOLITHIC and (uncoated) LAMINATE products can have
+# predefined TIR and emissivity values.
+PREDEFINED_THERMAL_VALUES_SUBTYPE_NAMES = frozenset((_MONOLITHIC_NAME, _LAMINATE_NAME))
 
+
+@fast_to_dict
 @dataclass_json
-@dataclass
+@dataclass(slots=True)
 class Manufacturer:
     id: int = None
     name: str = None
     extension: str = None
 
 
+@fast_to_dict
 @dataclass_json
-@dataclass
+@dataclass(slots=True)
 class ProductDescription:
     name: Optional[str] = None
     short_description: Optional[str] = None
@@ -238,8 +260,9 @@ class ProductDescription:
     marketing_appearance: Optional[str] = None
 
 
+@fast_to_dict
 @dataclass_json
-@dataclass
+@dataclass(slots=True)
 class PhysicalProperties:
     thickness: Optional[Decimal] = None
     permeability_factor: Optional[Decimal] = None
@@ -262,14 +285,16 @@ class PhysicalProperties:
             self.optical_properties = OpticalProperties()
 
 
+@fast_to_dict
 @dataclass_json
-@dataclass
+@dataclass(slots=True)
 class BaseGeometry:
     pass
 
 
+@fast_to_dict
 @dataclass_json
-@dataclass
+@dataclass(slots=True)
 class BlindGeometry(BaseGeometry):
     """
     Geometry definition for ven blinds.
@@ -399,14 +424,16 @@ class BlindGeometry(BaseGeometry):
         return self.slat_curvature
 
 
+@fast_to_dict
 @dataclass_json
-@dataclass
+@dataclass(slots=True)
 class VenetianBlindGeometry(BlindGeometry):
     pass
 
 
+@fast_to_dict
 @dataclass_json
-@dataclass
+@dataclass(slots=True)
 class VerticalLouverGeometry(BlindGeometry):
     pass
 
@@ -417,8 +444,9 @@ class PerforatedScreenGeometryType(Enum):
     RECTANGLE = 2
 
 
+@fast_to_dict
 @dataclass_json
-@dataclass
+@dataclass(slots=True)
 class PerforatedScreenGeometry(BaseGeometry):
     """
     Defines the geometric properties of a Perforated screen.
@@ -439,22 +467,25 @@ class PerforatedScreenGeometry(BaseGeometry):
     spacing_y: Optional[str] = None
 
 
+@fast_to_dict
 @dataclass_json
-@dataclass
+@dataclass(slots=True)
 class WovenShadeGeometry(BaseGeometry):
     thread_diameter: Optional[str] = None
     thread_spacing: Optional[str] = None
     shade_thickness: Optional[str] = None
 
 
+@fast_to_dict
 @dataclass_json
-@dataclass
+@dataclass(slots=True)
 class GeometricProperties:
     geometry: Optional[BaseGeometry] = None
 
 
+@fast_to_dict
 @dataclass_json
-@dataclass
+@dataclass(slots=True)
 class InterlayerDetails:
     interlayer_id: Optional[int] = None
     interlayer_appearance: Optional[str] = None
@@ -464,8 +495,9 @@ class InterlayerDetails:
     interlayer_material: Optional[str] = None
 
 
+@fast_to_dict
 @dataclass_json
-@dataclass
+@dataclass(slots=True)
 class IntegratedSpectralAveragesSummary:
     summary_values: Optional[IntegratedSpectralAveragesSummaryValues] = None
     calculation_standard: Optional[str] = None
@@ -475,8 +507,9 @@ class IntegratedSpectralAveragesSummary:
     source_version: Optional[str] = None
 
 
+@fast_to_dict
 @dataclass_json
-@dataclass
+@dataclass(slots=True)
 class CompositionDetails:
     """
     Some composition layers have a composition_details dictionary
@@ -507,8 +540,9 @@ class CompositionDetails:
     coated_side_faces_exterior: Optional[bool] = None
 
 
+@fast_to_dict
 @dataclass_json
-@dataclass
+@dataclass(slots=True)
 class NewProductDefinition:
     """
     A simpler version of the Product dataclass, meant for
@@ -548,8 +582,9 @@ class NewProductDefinition:
     # legacy_filename: Optional[str] = None
 
 
+@fast_to_dict
 @dataclass_json
-@dataclass
+@dataclass(slots=True)
 class ProductComposition:
     """
     A simple dataclass to represent composition layers in a Product.
@@ -574,8 +609,9 @@ class ProductComposition:
     igdb_layer_glazing_id: Optional[int] = None
 
 
+@fast_to_dict
 @dataclass_json
-@dataclass
+@dataclass(slots=True)
 class ShadeLayerProperties:
     """
     Holds ShadingLayer properties from CGDB
@@ -589,6 +625,7 @@ class ShadeLayerProperties:
     timestamp: Optional[int] = None
 
 
+@fast_to_dict
 @dataclass_json
 @dataclass
 class IGSDBObject:
@@ -596,10 +633,35 @@ class IGSDBObject:
     uuid: Optional[str] = None
 
 
+@lru_cache(maxsize=1024)
+def _parse_mdb_time(mdb_time_created: str) -> datetime:
+    # Time_Created values from the legacy IGDB / CGDB .mdb databases.
+    # strptime is slow, and the same string always gives the same
+    # (immutable) datetime, so remember recent results.
+    return datetime.strptime(mdb_time_created, "%Y-%m-%d %H:%M:%S")
+
+
+# Getters for the calculated (ThermalIRResults) and
+# predefined (PhysicalProperties) TIR and emissivity values.
+_get_tir_front = attrgetter("transmittance_front")
+_get_tir_back = attrgetter("transmittance_back")
+_get_emissivity_front = attrgetter("emissivity_front_hemispheric")
+_get_emissivity_back = attrgetter("emissivity_back_hemispheric")
+_get_predefined_tir_front = attrgetter("predefined_tir_front")
+_get_predefined_tir_back = attrgetter("predefined_tir_back")
+_get_predefined_emissivity_front = attrgetter("predefined_emissivity_front")
+_get_predefined_emissivity_back = attrgetter("predefined_emissivity_back")
+
+
 # NOTE: It's difficult to do getters/setters on a dataclass and handle init correctly
 # Settled on this approach: https://github.com/florimondmanca/www/issues/102#issuecomment-733947821
+# (This is also why BaseProduct, unlike the other dataclasses here, isn't slotted:
+# the properties store their values in private attributes that aren't fields.)
 
 
+@fast_json
+@fast_from_dict
+@fast_to_dict
 @dataclass_json
 @dataclass
 class BaseProduct(IGSDBObject):
@@ -726,10 +788,10 @@ class BaseProduct(IGSDBObject):
 
     def set_type(self, v: str) -> None:
         if v is not None:
-            try:
-                ProductType[v]
-            except KeyError:
+            name = _PRODUCT_TYPE_NAMES.get(v)
+            if name is None:
                 raise ValueError(f"Invalid product type: {v}")
+            v = name
         self._type = v
 
     def get_subtype(self) -> str:
@@ -737,10 +799,10 @@ class BaseProduct(IGSDBObject):
 
     def set_subtype(self, v: str) -> None:
         if v is not None:
-            try:
-                ProductSubtype[v]
-            except KeyError:
+            name = _PRODUCT_SUBTYPE_NAMES.get(v)
+            if name is None:
                 raise ValueError(f"Invalid product subtype: {v}")
+            v = name
         self._subtype = v
 
     def get_token_type(self) -> Optional[str]:
@@ -748,23 +810,24 @@ class BaseProduct(IGSDBObject):
 
     def set_token_type(self, v: str) -> None:
         if v is not None:
-            try:
-                TokenType[v]
-            except KeyError:
+            name = _TOKEN_TYPE_NAMES.get(v)
+            if name is None:
                 raise ValueError(f"Invalid product token type: {v}")
+            v = name
         self._token_type = v
 
+    def _get_mdb_time_created(self) -> Optional[datetime]:
+        if self.type == _GLAZING_NAME and self.mdb_time_created:
+            return _parse_mdb_time(self.mdb_time_created)
+        return None
+
     @property
     def igdb_time_created(self) -> Optional[datetime]:
-        if self.type == ProductType.GLAZING.name and self.mdb_time_created:
-            return datetime.strptime(self.mdb_time_created, "%Y-%m-%d %H:%M:%S")
-        return None
+        return self._get_mdb_time_created()
 
     @property
     def cgdb_time_created(self) -> Optional[datetime]:
-        if self.type == ProductType.GLAZING.name and self.mdb_time_created:
-            return datetime.strptime(self.mdb_time_created, "%Y-%m-%d %H:%M:%S")
-        return None
+        return self._get_mdb_time_created()
 
     @property
     def name(self) -> Optional[str]:
@@ -778,19 +841,23 @@ class BaseProduct(IGSDBObject):
             return self.product_description.marketing_name
         return None
 
+    def _ensure_description(self) -> ProductDescription:
+        """
+        Returns the product description, creating an empty one first
+        if the product doesn't have one yet.
+        """
+        description = self.product_description
+        if description is None:
+            description = self.product_description = ProductDescription()
+        return description
+
     @marketing_name.setter
     def marketing_name(self, v: str) -> None:
-        if self.product_description:
-            self.product_description.marketing_name = v
-        else:
-            self.product_description = ProductDescription(marketing_name=v)
+        self._ensure_description().marketing_name = v
 
     @name.setter
     def name(self, v: str) -> None:
-        if self.product_description:
-            self.product_description.name = v
-        else:
-            self.product_description = ProductDescription(name=v)
+        self._ensure_description().name = v
 
     @property
     def has_thermal_ir_wavelengths(self) -> bool:
@@ -808,81 +875,66 @@ class BaseProduct(IGSDBObject):
 
     # GETTERS for TIR and Emissivity
 
-    def get_tir_front(self, calculation_standard_name: str = "NFRC") -> Optional[float]:
+    def _get_thermal_value(
+        self,
+        calculation_standard_name: str,
+        get_calculated_value: Callable,
+        get_predefined_value: Callable,
+    ) -> Optional[Union[float, str]]:
+        """
+        Returns the calculated value for the given standard if there is one
+        (a float), otherwise the predefined value, if any. Predefined values
+        are returned as the string given in the submission file, to keep
+        their exact precision; convert with float() or Decimal() as needed.
+        """
         # If we have a calculated value for the given standard, return that...
         if self.integrated_spectral_averages_summaries:
             for summary in self.integrated_spectral_averages_summaries:
                 if summary.calculation_standard == calculation_standard_name:
-                    try:
-                        value = summary.summary_values.thermal_ir.transmittance_front
-                        if value is not None:
-                            return value
-                    except Exception:
+                    summary_values = summary.summary_values
+                    if summary_values is None or summary_values.thermal_ir is None:
                         # not defined
-                        pass
+                        continue
+                    value = get_calculated_value(summary_values.thermal_ir)
+                    if value is not None:
+                        return value
         # If we don't have a calculated value, return a 'user defined' value, if any.
         if self.physical_properties:
-            return self.physical_properties.predefined_tir_front
+            return get_predefined_value(self.physical_properties)
 
         return None
 
-    def get_tir_back(self, calculation_standard_name: str = "NFRC") -> Optional[float]:
-        # If we have a calculated value for the given standard, return that...
-        if self.integrated_spectral_averages_summaries:
-            for summary in self.integrated_spectral_averages_summaries:
-                if summary.calculation_standard == calculation_standard_name:
-                    try:
-                        value = summary.summary_values.thermal_ir.transmittance_back
-                        if value is not None:
-                            return value
-                    except Exception:
-                        # not defined
-                        pass
-        # If we don't have a calculated value, return a 'user defined' value, if any.
-        if self.physical_properties:
-            return self.physical_properties.predefined_tir_back
+    def get_tir_front(
+        self, calculation_standard_name: str = "NFRC"
+    ) -> Optional[Union[float, str]]:
+        return self._get_thermal_value(
+            calculation_standard_name, _get_tir_front, _get_predefined_tir_front
+        )
 
-        return None
+    def get_tir_back(
+        self, calculation_standard_name: str = "NFRC"
+    ) -> Optional[Union[float, str]]:
+        return self._get_thermal_value(
+            calculation_standard_name, _get_tir_back, _get_predefined_tir_back
+        )
 
     def get_emissivity_front(
         self, calculation_standard_name: str = "NFRC"
-    ) -> Optional[float]:
-        # If we have a calculated value for the given standard, return that...
-        if self.integrated_spectral_averages_summaries:
-            for summary in self.integrated_spectral_averages_summaries:
-                if summary.calculation_standard == calculation_standard_name:
-                    try:
-                        value = summary.summary_values.thermal_ir.emissivity_front_hemispheric
-                        if value is not None:
-                            return value
-                    except Exception:
-                        # not defined
-                        pass
-        # If we don't have a calculated value, return a 'user defined' value, if any.
-        if self.physical_properties:
-            return self.physical_properties.predefined_emissivity_front
-
-        return None
+    ) -> Optional[Union[float, str]]:
+        return self._get_thermal_value(
+            calculation_standard_name,
+            _get_emissivity_front,
+            _get_predefined_emissivity_front,
+        )
 
     def get_emissivity_back(
         self, calculation_standard_name: str = "NFRC"
-    ) -> Optional[float]:
-        # If we have a calculated value for the given standard, return that...
-        if self.integrated_spectral_averages_summaries:
-            for summary in self.integrated_spectral_averages_summaries:
-                if summary.calculation_standard == calculation_standard_name:
-                    try:
-                        value = summary.summary_values.thermal_ir.emissivity_back_hemispheric
-                        if value is not None:
-                            return value
-                    except Exception:
-                        # not defined
-                        pass
-        # If we don't have a calculated value, return a 'user defined' value, if any.
-        if self.physical_properties:
-            return self.physical_properties.predefined_emissivity_back
-
-        return None
+    ) -> Optional[Union[float, str]]:
+        return self._get_thermal_value(
+            calculation_standard_name,
+            _get_emissivity_back,
+            _get_predefined_emissivity_back,
+        )
 
     @property
     def can_have_predefined_thermal_values(self) -> bool:
@@ -900,13 +952,11 @@ class BaseProduct(IGSDBObject):
         Returns:
         Boolean value, true if product can have predefined values defined for emissivity or TIR.
         """
-        if self.subtype not in [
-            ProductSubtype.MONOLITHIC.name,
-            ProductSubtype.LAMINATE.name,
-        ]:
+        subtype = self.subtype
+        if subtype not in PREDEFINED_THERMAL_VALUES_SUBTYPE_NAMES:
             # only MONOLITHIC and uncoated LAMINATE can have predefined thermal values
             return False
-        if self.subtype == ProductSubtype.LAMINATE.name:
+        if subtype == _LAMINATE_NAME:
             if self.has_coating_on_surface:
                 # only an uncoated LAMINATE can have predefined thermal values
                 return False
@@ -923,24 +973,46 @@ class BaseProduct(IGSDBObject):
         Boolean indicating whether product has a COATING on an outward facing
         surface.
         """
-        if self.subtype != ProductSubtype.LAMINATE.name:
+        if self.subtype != _LAMINATE_NAME or not self.composition:
             return False
-        if self.composition:
-            for layer_index, composition_layer in enumerate(self.composition):
-                if composition_layer.get("subtype", None) == ProductSubtype.COATED.name:
-                    composition_details: CompositionDetails = (
-                        composition_layer.composition_details
-                    )
-                    if (
-                        composition_details
-                        and composition_details.coated_side_faces_exterior
-                    ):
-                        return composition_details.coated_side_faces_exterior
+        for composition_layer in self.composition:
+            # Layers may still be the submitted dictionaries rather than
+            # ProductComposition instances.
+            if isinstance(composition_layer, dict):
+                if composition_layer.get("subtype") != _COATED_NAME:
+                    continue
+                details = composition_layer.get("composition_details")
+            else:
+                if composition_layer.subtype != _COATED_NAME:
+                    continue
+                details = composition_layer.composition_details
+            if isinstance(details, dict):
+                coated_side_faces_exterior = details.get("coated_side_faces_exterior")
+            elif details is not None:
+                coated_side_faces_exterior = details.coated_side_faces_exterior
+            else:
+                continue
+            if coated_side_faces_exterior:
+                return True
         return False
 
 
-BaseProduct.type = property(BaseProduct.get_type, BaseProduct.set_type)
-BaseProduct.subtype = property(BaseProduct.get_subtype, BaseProduct.set_subtype)
+# Values are validated whenever they're set (in __init__ or later), but
+# reading them is just an attribute lookup, so read through attrgetter
+# rather than calling the get_ methods.
+BaseProduct.type = property(attrgetter("_type"), BaseProduct.set_type)
+BaseProduct.subtype = property(attrgetter("_subtype"), BaseProduct.set_subtype)
 BaseProduct.token_type = property(
-    BaseProduct.get_token_type, BaseProduct.set_token_type
+    attrgetter("_token_type"), BaseProduct.set_token_type
 )
+
+
+def load_product_json(path: Union[str, os.PathLike]) -> BaseProduct:
+    """
+    Loads a product from a JSON file.
+
+    The file is read as bytes and parsed as-is (by orjson when it's
+    installed), which skips decoding the whole document to a str first.
+    """
+    with open(path, "rb") as f:
+        return BaseProduct.from_dict(loads(f.read()))
@@ -0,0 +1,526 @@
+"""
+JSON helpers shared by the dataclasses in this library.
+
+orjson is used to parse and render JSON when it is installed
+(e.g. pip install py_igsdb_base_data[orjson]); otherwise we fall back
+to the standard library json module. Both produce equivalent JSON,
+although orjson's output is compact (no spaces after separators)
+and is not ASCII-escaped. orjson can't read or write NaN and Infinity
+(it renders them as null), so documents with non-finite numbers are
+handled by the json module.
+"""
+
+import copy
+import json
+import warnings
+from collections.abc import Collection, Mapping
+from dataclasses import MISSING, fields, is_dataclass
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from math import isfinite
+from typing import Any, Callable, Dict, Optional, Type, TypeVar, Union
+from typing import get_args, get_origin, get_type_hints
+from uuid import UUID
+
+from dataclasses_json import DataClassJsonMixin
+from dataclasses_json import cfg
+
+# fast_to_dict() and fast_from_dict() reuse these private dataclasses_json
+# helpers (setup.py / setup.cfg pin the version they were written against).
+# If a dataclasses_json release drops them, the decorators leave the
+# classes' own to_dict() / from_dict() in place.
+try:
+    from dataclasses_json.core import _asdict, _decode_dataclass, _support_extended_types
+    from dataclasses_json.utils import _is_optional
+except ImportError:  # pragma: no cover - depends on dataclasses_json version
+    _asdict = _decode_dataclass = _support_extended_types = _is_optional = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+T = TypeVar("T")
+
+if orjson is not None:
+    # Let json_default() handle datetimes (as timestamps, like
+    # dataclasses_json) and allow the non-string dict keys that
+    # json.dumps would accept.
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+def json_default(obj: Any) -> Any:
+    """
+    Encode the non-JSON types that appear in our dataclasses the
+    same way dataclasses_json does.
+    """
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, datetime):
+        return obj.timestamp()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def loads(s: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """
+    Parse a JSON document.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # e.g. NaN or Infinity, which orjson rejects. json.loads()
+            # parses those, and raises the same error for invalid JSON.
+            pass
+    return json.loads(s)
+
+
+def dumps(obj: Any) -> str:
+    """
+    Render obj as a JSON string.
+    """
+    if orjson is not None and not _has_non_finite(obj):
+        try:
+            return orjson.dumps(
+                obj, default=json_default, option=_ORJSON_OPTIONS
+            ).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits, which orjson rejects.
+            # json.dumps() writes those, and raises the same error for
+            # objects that can't be serialized.
+            pass
+    return json.dumps(obj, default=json_default)
+
+
+# Field names of the dataclasses _has_non_finite() has looked at.
+_FIELD_NAMES: Dict[type, tuple] = {}
+
+
+def _has_non_finite(value: Any) -> bool:
+    """
+    Returns True if value holds a NaN or infinite float anywhere in its
+    lists, tuples, dicts or dataclass fields.
+    """
+    value_type = type(value)
+    if value_type is float:
+        return not isfinite(value)
+    if value_type in _ATOMIC_TYPES:
+        return False
+    if value_type is list or value_type is tuple:
+        return any(_has_non_finite(item) for item in value)
+    if value_type is dict:
+        return any(
+            _has_non_finite(k) or _has_non_finite(v) for k, v in value.items()
+        )
+    if is_dataclass(value) and not isinstance(value, type):
+        try:
+            names = _FIELD_NAMES[value_type]
+        except KeyError:
+            names = _FIELD_NAMES[value_type] = tuple(f.name for f in fields(value))
+        return any(_has_non_finite(getattr(value, name)) for name in names)
+    if isinstance(value, float):
+        return not isfinite(value)
+    return False
+
+
+def fast_json(cls: Optional[Type[T]] = None, *, native: bool = False):
+    """
+    Class decorator that swaps the JSON parsing / rendering behind the
+    to_json() and from_json() methods added by @dataclass_json for
+    the faster helpers above. The dictionary conversion (to_dict() /
+    from_dict()) is left to the class (see fast_to_dict and
+    fast_from_dict below).
+
+    Must be applied *above* @dataclass_json, which would otherwise
+    overwrite these methods. Calls that pass any of the json module's
+    keyword arguments (indent, sort_keys, parse_float, etc.) are
+    handed to the original dataclasses_json implementation.
+
+    With native=True, to_json() lets orjson (when installed) serialize
+    the dataclass directly instead of going through to_dict() first,
+    which avoids copying every nested list and dict. This is only
+    allowed on slotted dataclasses: orjson reads the instance __dict__
+    of a regular dataclass, which would skip properties and include
+    private attributes, whereas for a slotted class it reads the
+    dataclass fields just like to_dict() does. Objects holding NaN or
+    infinite values, and classes (or nested classes) with field
+    encoders, still go through to_dict(), as do all calls while global
+    encoders are registered.
+    """
+
+    def decorate(klass: Type[T]) -> Type[T]:
+        if native and "__slots__" not in klass.__dict__:
+            raise TypeError(
+                f"fast_json(native=True) requires a slotted dataclass, "
+                f"got {klass.__name__}"
+            )
+
+        def to_json(self, **kw) -> str:
+            if kw:
+                return DataClassJsonMixin.to_json(self, **kw)
+            if (
+                native
+                and orjson is not None
+                and not cfg.global_config.encoders
+                and not _uses_field_encoders(type(self))
+                and not _has_non_finite(self)
+            ):
+                try:
+                    return orjson.dumps(
+                        self, default=json_default, option=_ORJSON_OPTIONS
+                    ).decode()
+                except orjson.JSONEncodeError:
+                    # See dumps().
+                    pass
+            return dumps(self.to_dict(encode_json=False))
+
+        def from_json(klass, s, *, infer_missing=False, **kw):
+            if kw:
+                return DataClassJsonMixin.from_json.__func__(
+                    klass, s, infer_missing=infer_missing, **kw
+                )
+            return klass.from_dict(loads(s), infer_missing=infer_missing)
+
+        klass.to_json = to_json
+        klass.from_json = classmethod(from_json)
+        return klass
+
+    if cls is None:
+        return decorate
+    return decorate(cls)
+
+
+# Values that dataclasses_json's to_dict() copies with copy.deepcopy(),
+# which returns these unchanged.
+_ATOMIC_TYPES = frozenset((type(None), str, int, float, bool, Decimal))
+
+# Generated to_dict() functions, by dataclass.
+_TO_DICT_FUNCTIONS: Dict[type, Callable] = {}
+
+# Field settings that change how dataclasses_json renders a field.
+_ENCODING_FIELD_CONFIG = ("encoder", "exclude", "letter_case")
+
+
+def _to_builtins(value: Any) -> Any:
+    """
+    Convert a field value the way dataclasses_json's to_dict()
+    (with encode_json=False) does: nested dataclasses become dicts,
+    mappings are copied to dicts and other collections to lists.
+    """
+    value_type = type(value)
+    if value_type in _ATOMIC_TYPES:
+        return value
+    if value_type is list:
+        return [_to_builtins(item) for item in value]
+    if value_type is dict:
+        return {_to_builtins(k): _to_builtins(v) for k, v in value.items()}
+    if is_dataclass(value) and not isinstance(value, type):
+        return _get_to_dict_function(value_type)(value)
+    if isinstance(value, Mapping):
+        return {_to_builtins(k): _to_builtins(v) for k, v in value.items()}
+    if isinstance(value, Enum):
+        return value
+    if isinstance(value, Collection) and not isinstance(value, (str, bytes)):
+        return [_to_builtins(item) for item in value]
+    return copy.deepcopy(value)
+
+
+def _dataclass_types(value_type: Any) -> list:
+    """
+    Returns the dataclasses named in a field annotation, e.g. X for
+    Optional[List[X]].
+    """
+    if isinstance(value_type, type):
+        return [value_type] if is_dataclass(value_type) else []
+    return [t for arg in get_args(value_type) for t in _dataclass_types(arg)]
+
+
+# Whether a dataclass, or one nested in it, uses field encoders.
+_USES_FIELD_ENCODERS: Dict[type, bool] = {}
+
+
+def _uses_field_encoders(cls: type) -> bool:
+    try:
+        return _USES_FIELD_ENCODERS[cls]
+    except KeyError:
+        pass
+    # Assume not while the nested classes are checked, in case they
+    # refer back to cls.
+    _USES_FIELD_ENCODERS[cls] = False
+    result = _has_encoding_config(cls) or any(
+        _uses_field_encoders(nested_cls)
+        for field_type in get_type_hints(cls).values()
+        for nested_cls in _dataclass_types(field_type)
+    )
+    _USES_FIELD_ENCODERS[cls] = result
+    return result
+
+
+def _has_encoding_config(cls: type) -> bool:
+    if getattr(cls, "dataclass_json_config", None):
+        return True
+    for class_field in fields(cls):
+        field_config = class_field.metadata.get("dataclasses_json", {})
+        if any(field_config.get(key) is not None for key in _ENCODING_FIELD_CONFIG):
+            return True
+    return False
+
+
+def _make_to_dict_function(cls: type) -> Callable:
+    if _has_encoding_config(cls):
+        # Leave encoders, excluded fields, letter case, etc. to dataclasses_json.
+        return _asdict
+    # Generate the conversion with the fields written out, e.g.
+    #
+    #     def to_dict(self):
+    #         return {
+    #             "name": _to_builtins(self.name),
+    #             ...
+    #         }
+    lines = ["def to_dict(self):", "    return {"]
+    for class_field in fields(cls):
+        lines.append(f"        {class_field.name!r}: _to_builtins(self.{class_field.name}),")
+    lines.append("    }")
+    namespace = {"_to_builtins": _to_builtins}
+    exec("\n".join(lines), namespace)
+    return namespace["to_dict"]
+
+
+def _get_to_dict_function(cls: type) -> Callable:
+    try:
+        return _TO_DICT_FUNCTIONS[cls]
+    except KeyError:
+        function = _TO_DICT_FUNCTIONS[cls] = _make_to_dict_function(cls)
+        return function
+
+
+def fast_to_dict(cls: Type[T]) -> Type[T]:
+    """
+    Class decorator that replaces the to_dict() method added by
+    @dataclass_json with one generated for the class's fields, which
+    avoids dataclasses_json's per-value reflection. The result is the
+    same dictionary dataclasses_json would build (nested dataclasses
+    are converted too, and lists and dicts are copied).
+
+    Must be applied *above* @dataclass_json. Calls with encode_json=True,
+    and classes that use field encoders, exclusions or letter case, are
+    handed to dataclasses_json.
+    """
+
+    if _asdict is None:  # pragma: no cover - depends on dataclasses_json version
+        return cls
+
+    def to_dict(self, encode_json=False) -> Dict[str, Any]:
+        if encode_json or cfg.global_config.encoders:
+            return _asdict(self, encode_json=encode_json)
+        return _get_to_dict_function(type(self))(self)
+
+    cls.to_dict = to_dict
+    return cls
+
+
+# Generated from_dict() functions, by dataclass.
+_FROM_DICT_FUNCTIONS: Dict[type, Callable] = {}
+
+# Field settings that change how dataclasses_json reads a field.
+_DECODING_FIELD_CONFIG = ("letter_case", "undefined")
+
+# Other types that dataclasses_json converts with _support_extended_types().
+_EXTENDED_TYPES = (Decimal, datetime, UUID)
+
+
+class _UnsupportedType(Exception):
+    pass
+
+
+def _pass_through(value: Any, infer_missing: bool) -> Any:
+    return value
+
+
+def _make_value_decoder(value_type: Any) -> Callable[[Any, bool], Any]:
+    """
+    Returns a function (value, infer_missing) -> value that decodes a
+    value of the given annotated type the way dataclasses_json does.
+    Raises _UnsupportedType for annotations we leave to dataclasses_json.
+    """
+    if value_type is Any:
+        return _pass_through
+    if isinstance(value_type, type):
+        if is_dataclass(value_type):
+
+            def decode_dataclass(value, infer_missing):
+                if is_dataclass(value):
+                    return value
+                return _get_from_dict_function(value_type)(value, infer_missing)
+
+            return decode_dataclass
+        if issubclass(value_type, Enum):
+            return lambda value, infer_missing: value_type(value)
+        if value_type in (int, float, str, bool):
+            return lambda value, infer_missing: (
+                value if isinstance(value, value_type) else value_type(value)
+            )
+        if value_type in _EXTENDED_TYPES:
+            return lambda value, infer_missing: _support_extended_types(value_type, value)
+        if value_type is dict:
+            return lambda value, infer_missing: dict(value)
+        if value_type is list:
+            return lambda value, infer_missing: list(value)
+        raise _UnsupportedType(value_type)
+
+    origin = get_origin(value_type)
+    args = get_args(value_type)
+    if origin is Union and len(args) == 2 and type(None) in args:
+        # Optional[X]
+        decode_item = _make_value_decoder(args[0] if args[1] is type(None) else args[1])
+
+        def decode_optional(value, infer_missing):
+            if value is None:
+                return None
+            return decode_item(value, infer_missing)
+
+        return decode_optional
+    if origin is list:
+        if not args or args[0] is Any:
+            return lambda value, infer_missing: list(value)
+        decode_item = _make_value_decoder(args[0])
+        return lambda value, infer_missing: [
+            decode_item(item, infer_missing) for item in value
+        ]
+    if origin is dict:
+        if not args or args == (Any, Any):
+            return lambda value, infer_missing: dict(value)
+        if args[0] is str:
+            decode_item = _make_value_decoder(args[1])
+            return lambda value, infer_missing: {
+                key: decode_item(item, infer_missing) for key, item in value.items()
+            }
+    raise _UnsupportedType(value_type)
+
+
+def _make_from_dict_function(cls: type) -> Callable:
+    """
+    Returns a function (kvs, infer_missing) -> instance of cls that builds
+    the dataclass from a dictionary like dataclasses_json's from_dict(),
+    with the type of every field resolved up front.
+    """
+    if getattr(cls, "dataclass_json_config", None):
+        return lambda kvs, infer_missing: _decode_dataclass(cls, kvs, infer_missing)
+
+    type_hints = get_type_hints(cls)
+    plan = []
+    for class_field in fields(cls):
+        field_config = class_field.metadata.get("dataclasses_json", {})
+        if any(field_config.get(key) is not None for key in _DECODING_FIELD_CONFIG):
+            return lambda kvs, infer_missing: _decode_dataclass(cls, kvs, infer_missing)
+        if not class_field.init:
+            # Not a constructor argument, so dataclasses_json skips it.
+            continue
+        field_type = type_hints[class_field.name]
+        decoder = field_config.get("decoder")
+        if decoder is not None:
+
+            def decode_value(value, infer_missing, decoder=decoder, field_type=field_type):
+                # Same shortcut as dataclasses_json for values that are
+                # already of the field's type.
+                if field_type is type(value):
+                    return value
+                return decoder(value)
+
+        else:
+            try:
+                decode_value = _make_value_decoder(field_type)
+            except _UnsupportedType:
+                return lambda kvs, infer_missing: _decode_dataclass(cls, kvs, infer_missing)
+        plan.append(
+            (
+                class_field.name,
+                class_field.default,
+                class_field.default_factory,
+                _is_optional(field_type),
+                decode_value,
+            )
+        )
+
+    def from_dict(kvs, infer_missing):
+        if type(kvs) is not dict:
+            # Instances of cls, None, other mappings, etc.
+            return _decode_dataclass(cls, kvs, infer_missing)
+        init_kwargs = {}
+        for name, default, default_factory, optional, decode_value in plan:
+            if name in kvs:
+                value = kvs[name]
+            elif default is not MISSING:
+                value = default
+            elif default_factory is not MISSING:
+                value = default_factory()
+            elif infer_missing:
+                value = None
+            else:
+                raise KeyError(name)
+            if value is None:
+                if not optional:
+                    _warn_none_value(cls, name, infer_missing)
+                init_kwargs[name] = None
+            else:
+                init_kwargs[name] = decode_value(value, infer_missing)
+        return cls(**init_kwargs)
+
+    return from_dict
+
+
+def _warn_none_value(cls: type, name: str, infer_missing: bool) -> None:
+    # The same warnings dataclasses_json gives.
+    warning = f"value of non-optional type {name} detected when decoding {cls.__name__}"
+    if infer_missing:
+        warnings.warn(
+            f"Missing {warning} and was defaulted to None by "
+            f"infer_missing=True. "
+            f"Set infer_missing=False (the default) to prevent "
+            f"this behavior.",
+            RuntimeWarning,
+        )
+    else:
+        warnings.warn(f"'NoneType' object {warning}.", RuntimeWarning)
+
+
+def _get_from_dict_function(cls: type) -> Callable:
+    try:
+        return _FROM_DICT_FUNCTIONS[cls]
+    except KeyError:
+        function = _FROM_DICT_FUNCTIONS[cls] = _make_from_dict_function(cls)
+        return function
+
+
+def fast_from_dict(cls: Type[T]) -> Type[T]:
+    """
+    Class decorator that replaces the from_dict() method added by
+    @dataclass_json with one that resolves the type of every field
+    (including nested dataclasses) once per class, rather than on
+    each call. Values are converted, defaults filled in and warnings
+    given just as dataclasses_json does.
+
+    Must be applied *above* @dataclass_json. Classes with a
+    dataclass_json config, letter case or undefined-parameter handling,
+    or with field types other than the plain ones used in this library,
+    are handed to dataclasses_json, as are all calls while global
+    decoders are registered.
+    """
+
+    if _decode_dataclass is None:  # pragma: no cover - depends on dataclasses_json version
+        return cls
+
+    def from_dict(klass, kvs, *, infer_missing=False):
+        if cfg.global_config.decoders:
+            return _decode_dataclass(klass, kvs, infer_missing)
+        return _get_from_dict_function(klass)(kvs, infer_missing)
+
+    cls.from_dict = classmethod(from_dict)
+    return cls
@@ -17,7 +17,7 @@ class CalculationStandardMethodTypes(Enum):
     TKR = "TKR"
 
 
-@dataclass
+@dataclass(slots=True)
 class CalculationStandard:
     name: str
     method_type: str
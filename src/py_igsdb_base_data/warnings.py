@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseWarning:
     warning_type: Optional[str] = None
     warning_subtype: Optional[str] = None
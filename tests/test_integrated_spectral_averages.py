@@ -0,0 +1,29 @@
+from unittest import TestCase
+
+from py_igsdb_base_data.integrated_spectral_averages import MeasurementType
+
+
+class TestMeasurementType(TestCase):
+
+    def test_get_types(self):
+        self.assertEqual(
+            MeasurementType.get_types(),
+            [
+                "tf", "tb", "rf", "rb",
+                "tf_dir_dif", "tb_dir_dif", "rf_dir_dif", "rb_dir_dif",
+                "tf_dir_hem", "tb_dir_hem", "rf_dir_hem", "rb_dir_hem",
+            ],
+        )
+        self.assertEqual(
+            MeasurementType.get_types(include_tb=False),
+            ["tf", "tb", "rf", "rb", "tf_dir_dif", "rf_dir_dif", "rb_dir_dif", "tf_dir_hem", "rf_dir_hem", "rb_dir_hem"],
+        )
+        self.assertEqual(MeasurementType.specular_types(), ["tf", "tb", "rf", "rb"])
+
+    def test_returned_lists_are_not_shared(self):
+        types = MeasurementType.get_types()
+        types.append("other")
+        self.assertNotIn("other", MeasurementType.get_types())
+        specular_types = MeasurementType.specular_types()
+        specular_types.clear()
+        self.assertEqual(len(MeasurementType.specular_types()), 4)
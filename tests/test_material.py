@@ -0,0 +1,24 @@
+from unittest import TestCase
+
+from py_igsdb_base_data.material import MATERIAL_TYPE_LOOKUP, MaterialType, material_type_lookup
+
+
+class TestMaterial(TestCase):
+
+    def test_material_type_lookup(self):
+        self.assertEqual(
+            material_type_lookup,
+            {
+                1: "UNKNOWN",
+                2: "NA",
+                3: "GLASS",
+                4: "PVB",
+                5: "POLYCARBONATE",
+                6: "ACRYLIC",
+                7: "PET",
+            },
+        )
+        self.assertIsNone(MATERIAL_TYPE_LOOKUP[0])
+        for material_type_id, name in material_type_lookup.items():
+            self.assertEqual(MATERIAL_TYPE_LOOKUP[material_type_id], name)
+            self.assertIn(name, MaterialType.__members__)
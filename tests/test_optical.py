@@ -1,9 +1,13 @@
+import copy
+import dataclasses
 import json
 from unittest import TestCase
 
 from py_igsdb_base_data.optical import OpticalStandardMethodResultsFactory, OpticalStandardMethodResults, \
     OpticalColorResultFactory, IntegratedSpectralAveragesSummaryValuesFactory, \
-    IntegratedSpectralAveragesSummaryValues, OpticalColorResult
+    IntegratedSpectralAveragesSummaryValues, OpticalColorResult, AngleBlock, SUMMARY_VALUE_PATHS, \
+    OpticalColorResults, OpticalData, OpticalProperties, ThermalIRResults
+from tests import utils
 
 
 class TestPhysicalPropertiesDataclass(TestCase):
@@ -26,3 +30,135 @@ class TestPhysicalPropertiesDataclass(TestCase):
 
         summary_values = IntegratedSpectralAveragesSummaryValues.from_dict(summary_dict)
         self.assertEqual(0.5165770985449425, summary_values.solar.reflectance_back.direct_direct)
+
+    def test_summary_values_are_slotted(self):
+        instance = IntegratedSpectralAveragesSummaryValuesFactory.create()
+        self.assertFalse(hasattr(instance, "__dict__"))
+        instance.thermal_ir.error = "Some error"
+        round_trip = IntegratedSpectralAveragesSummaryValues.from_dict(instance.to_dict())
+        self.assertEqual(round_trip.thermal_ir.error, "Some error")
+
+    def test_summary_values_convenience_getters(self):
+        summary_values = IntegratedSpectralAveragesSummaryValues()
+        self.assertIsNone(summary_values.tf_sol)
+        self.assertIsNone(summary_values.rf_ciex)
+
+        summary_values = IntegratedSpectralAveragesSummaryValuesFactory.create()
+        summary_values.solar.transmittance_front.direct_direct = 0.5
+        summary_values.color.reflectance_front.direct_direct.trichromatic.x = 0.25
+        self.assertEqual(summary_values.tf_sol, 0.5)
+        self.assertEqual(summary_values.rf_ciex, 0.25)
+
+        flattened = summary_values.flatten()
+        self.assertEqual(list(flattened), list(SUMMARY_VALUE_PATHS))
+        self.assertEqual(flattened["tf_sol"], 0.5)
+
+    def test_summary_values_get_value(self):
+        summary_values = IntegratedSpectralAveragesSummaryValuesFactory.create()
+        summary_values.photopic.reflectance_back.direct_direct = 0.125
+        self.assertEqual(summary_values.get_value("rb_vis"), 0.125)
+        self.assertIsNone(summary_values.get_value("tir_front"))
+        with self.assertRaises(ValueError):
+            summary_values.get_value("not_a_summary_value")
+
+    def test_summary_values_ensure_results(self):
+        summary_values = IntegratedSpectralAveragesSummaryValues()
+        summary_values.ensure_results("solar").transmittance_front.direct_direct = 0.5
+        self.assertEqual(summary_values.tf_sol, 0.5)
+        self.assertIsNone(summary_values.photopic)
+        self.assertIsNone(summary_values.color)
+
+        # Existing results are returned as-is.
+        self.assertIs(summary_values.ensure_results("solar"), summary_values.solar)
+        self.assertIsInstance(summary_values.ensure_results("color"), OpticalColorResults)
+        with self.assertRaises(ValueError):
+            summary_values.ensure_results("tf_sol")
+
+    def test_summary_values_set_value(self):
+        summary_values = IntegratedSpectralAveragesSummaryValues()
+        summary_values.set_value("tf_sol", 0.5)
+        summary_values.set_value("tir_front", 0.0)
+        summary_values.set_value("tf_ciex", 0.25)
+        self.assertEqual(summary_values.tf_sol, 0.5)
+        self.assertEqual(summary_values.tir_front, 0.0)
+        self.assertEqual(summary_values.tf_ciex, 0.25)
+
+        # Only the results on the path to each value are created.
+        self.assertIsNone(summary_values.solar.transmittance_back)
+        self.assertIsNone(summary_values.photopic)
+        self.assertIsNone(summary_values.color.transmittance_front.direct_direct.lab)
+        self.assertIsNone(summary_values.color.reflectance_front)
+
+        # Existing results are updated in place.
+        solar = summary_values.solar
+        summary_values.set_value("tf_sol_dir_dif", 0.1)
+        self.assertIs(summary_values.solar, solar)
+        self.assertEqual(solar.transmittance_front.direct_diffuse, 0.1)
+        with self.assertRaises(ValueError):
+            summary_values.set_value("not_a_summary_value", 0.1)
+
+    def test_thermal_ir_results_aliases(self):
+        thermal_ir = ThermalIRResults(
+            transmittance_front_diffuse_diffuse=0.1,
+            transmittance_back_diffuse_diffuse=0.2,
+            emissivity_front_hemispheric=0.84,
+            emissivity_back_hemispheric=0.04,
+        )
+        self.assertEqual(thermal_ir.transmittance_front, 0.1)
+        self.assertEqual(thermal_ir.transmittance_back, 0.2)
+        self.assertEqual(thermal_ir.absorptance_front_hemispheric, 0.84)
+        self.assertEqual(thermal_ir.absorptance_back_hemispheric, 0.04)
+        self.assertIsNone(ThermalIRResults().transmittance_front)
+        with self.assertRaises(AttributeError):
+            thermal_ir.transmittance_front = 0.5
+        self.assertNotIn("transmittance_front", dataclasses.asdict(thermal_ir))
+
+    def test_thermal_ir_results_aliases_keep_zero(self):
+        # An opaque layer has zero IR transmittance: that is a value, not a missing one.
+        thermal_ir = ThermalIRResults(
+            transmittance_front_diffuse_diffuse=0.0,
+            transmittance_back_diffuse_diffuse=0.0,
+            emissivity_front_hemispheric=0.0,
+            emissivity_back_hemispheric=0.0,
+        )
+        for value in (
+            thermal_ir.transmittance_front,
+            thermal_ir.transmittance_back,
+            thermal_ir.absorptance_front_hemispheric,
+            thermal_ir.absorptance_back_hemispheric,
+        ):
+            self.assertEqual(value, 0.0)
+            self.assertIsNotNone(value)
+
+    def test_angle_block_from_json(self):
+        angle_block_dict = utils.sample_optical_data()["angle_blocks"][0]
+        angle_block = AngleBlock.from_json(json.dumps(angle_block_dict))
+        self.assertEqual(angle_block.num_wavelengths, 477)
+        self.assertEqual(angle_block.wavelength_data, angle_block_dict["wavelength_data"])
+        self.assertEqual(AngleBlock.from_json(angle_block.to_json()), angle_block)
+
+    def test_from_dict_copies_wavelength_rows(self):
+        d = copy.deepcopy(utils.sample_optical_data())
+        a = OpticalData.from_dict(d)
+        b = OpticalData.from_dict(d)
+        original = d["angle_blocks"][0]["wavelength_data"][0]["w"]
+        a.angle_blocks[0].wavelength_data[0]["w"] = "99.0"
+        self.assertEqual(d["angle_blocks"][0]["wavelength_data"][0]["w"], original)
+        self.assertEqual(b.angle_blocks[0].wavelength_data[0]["w"], original)
+
+    def test_has_thermal_ir_wavelengths(self):
+        optical_properties = OpticalProperties()
+        self.assertFalse(optical_properties.has_thermal_ir_wavelengths)
+
+        optical_properties.optical_data = OpticalData(angle_blocks=[AngleBlock()])
+        self.assertFalse(optical_properties.has_thermal_ir_wavelengths)
+
+        optical_properties.optical_data.angle_blocks[0].wavelength_data.append({"w": "2.5"})
+        self.assertFalse(optical_properties.has_thermal_ir_wavelengths)
+
+        optical_properties.optical_data.angle_blocks[0].wavelength_data.append({"w": "25.0"})
+        self.assertTrue(optical_properties.has_thermal_ir_wavelengths)
+
+        # Sample data goes out to 40 micrometers
+        optical_properties.optical_data = OpticalData.from_dict(utils.sample_optical_data())
+        self.assertTrue(optical_properties.has_thermal_ir_wavelengths)
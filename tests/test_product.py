@@ -1,5 +1,6 @@
 import json
 from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 from typing import Optional, List
 from unittest import TestCase
@@ -14,7 +15,13 @@ from py_igsdb_base_data.product import (
     ProductSubtype,
     TokenType,
     BlindGeometry,
+    CompositionDetails,
+    ProductComposition,
+    IntegratedSpectralAveragesSummary,
+    IGSDB_TOKEN_TYPE_NAMES,
+    load_product_json,
 )
+from py_igsdb_base_data.optical import IntegratedSpectralAveragesSummaryValues, ThermalIRResults
 
 from src.py_igsdb_base_data.optical import AngleBlock, OpticalData, OpticalProperties
 from src.py_igsdb_base_data.product import ProductDescription
@@ -101,12 +108,26 @@ class TestDataclass(TestCase):
         # Makes sure nested data was transformed to dataclasses by dataclasses-json
         self.assertEqual(type(physical_properties), PhysicalProperties)
 
+    def test_load_product_json(self):
+        example_product_json = Path("tests/data/valid_monolithic_1.json")
+        product = load_product_json(example_product_json)
+        self.assertEqual(product, BaseProduct.from_json(example_product_json.read_text()))
+
     def test_marketing_name(self):
         pd = ProductDescription(marketing_name="Some name")
         p = BaseProduct()
         p.product_description = pd
         self.assertEqual(p.marketing_name, "Some name")
 
+    def test_name_setters_share_description(self):
+        p = BaseProduct()
+        p.marketing_name = "Some marketing name"
+        description = p.product_description
+        p.name = "Some name"
+        self.assertIs(p.product_description, description)
+        self.assertEqual(p.name, "Some name")
+        self.assertEqual(p.marketing_name, "Some marketing name")
+
     def test_cannot_set_wrong_product_type(self):
         # Test init
         with pytest.raises(ValueError):
@@ -136,6 +157,25 @@ class TestDataclass(TestCase):
             product = BaseProduct()
             product.token_type = "INVALID"
 
+    def test_product_type_names_are_canonical(self):
+        subtype = "".join(["LAMI", "NATE"])  # a new string, e.g. decoded from JSON
+        p = BaseProduct(type="GLAZING", subtype=subtype, token_type="PUBLISHED")
+        self.assertEqual(p.subtype, ProductSubtype.LAMINATE.name)
+        self.assertIs(p.subtype, ProductSubtype.LAMINATE.name)
+
+    def test_igsdb_token_types(self):
+        self.assertEqual(TokenType.PUBLISHED.igsdb_types(), ["PUBLISHED", "UNDEFINED"])
+        self.assertIn(TokenType.UNDEFINED.name, IGSDB_TOKEN_TYPE_NAMES)
+        self.assertNotIn(TokenType.PROPOSED.name, IGSDB_TOKEN_TYPE_NAMES)
+
+    def test_mdb_time_created(self):
+        p = BaseProduct(type=ProductType.GLAZING.name, mdb_time_created="2006-03-14 09:26:53")
+        self.assertEqual(p.igdb_time_created, datetime(2006, 3, 14, 9, 26, 53))
+        self.assertEqual(p.cgdb_time_created, datetime(2006, 3, 14, 9, 26, 53))
+        self.assertIsNone(BaseProduct(type=ProductType.GLAZING.name).igdb_time_created)
+        with pytest.raises(ValueError):
+            BaseProduct(type=ProductType.GLAZING.name, mdb_time_created="2006-03-14").igdb_time_created
+
     def test_can_have_predefined_thermal_values(self): 
         
         p = BaseProduct(subtype=ProductSubtype.LAMINATE.name)
@@ -147,6 +187,101 @@ class TestDataclass(TestCase):
         p = BaseProduct(subtype=ProductSubtype.COATED.name)
         self.assertFalse(p.can_have_predefined_thermal_values)
 
+    def test_composition_layers_are_slotted(self):
+        layer = ProductComposition(composition_details=CompositionDetails())
+        self.assertFalse(hasattr(layer, "__dict__"))
+        self.assertFalse(hasattr(layer.composition_details, "__dict__"))
+
+    def test_has_coating_on_surface(self):
+        def laminate(coated_side_faces_exterior):
+            return BaseProduct(
+                subtype=ProductSubtype.LAMINATE.name,
+                composition=[
+                    ProductComposition(subtype=ProductSubtype.MONOLITHIC.name),
+                    ProductComposition(
+                        subtype=ProductSubtype.COATED.name,
+                        composition_details=CompositionDetails(
+                            coated_side_faces_exterior=coated_side_faces_exterior
+                        ),
+                    ),
+                ],
+            )
+
+        p = laminate(coated_side_faces_exterior=True)
+        self.assertTrue(p.has_coating_on_surface)
+        self.assertFalse(p.can_have_predefined_thermal_values)
+
+        p = laminate(coated_side_faces_exterior=False)
+        self.assertFalse(p.has_coating_on_surface)
+        self.assertTrue(p.can_have_predefined_thermal_values)
+
+        p = BaseProduct(subtype=ProductSubtype.LAMINATE.name)
+        self.assertFalse(p.has_coating_on_surface)
+
+    def test_has_coating_on_surface_with_dict_layers(self):
+        def laminate(coated_side_faces_exterior):
+            return BaseProduct(
+                subtype=ProductSubtype.LAMINATE.name,
+                composition=[
+                    {"subtype": ProductSubtype.MONOLITHIC.name},
+                    {
+                        "subtype": ProductSubtype.COATED.name,
+                        "composition_details": {
+                            "coated_side_faces_exterior": coated_side_faces_exterior
+                        },
+                    },
+                ],
+            )
+
+        p = laminate(coated_side_faces_exterior=True)
+        self.assertTrue(p.has_coating_on_surface)
+        self.assertFalse(p.can_have_predefined_thermal_values)
+
+        p = laminate(coated_side_faces_exterior=False)
+        self.assertFalse(p.has_coating_on_surface)
+        self.assertTrue(p.can_have_predefined_thermal_values)
+
+        p = BaseProduct(
+            subtype=ProductSubtype.LAMINATE.name,
+            composition=[{"subtype": ProductSubtype.COATED.name}],
+        )
+        self.assertFalse(p.has_coating_on_surface)
+
+    def test_thermal_value_getters(self):
+        p = BaseProduct(
+            physical_properties=PhysicalProperties(
+                predefined_tir_front="0.1",
+                predefined_tir_back="0.2",
+                predefined_emissivity_front="0.84",
+                predefined_emissivity_back="0.85",
+            ),
+            integrated_spectral_averages_summaries=[
+                IntegratedSpectralAveragesSummary(calculation_standard="CEN"),
+                IntegratedSpectralAveragesSummary(
+                    calculation_standard="NFRC",
+                    summary_values=IntegratedSpectralAveragesSummaryValues(),
+                ),
+                IntegratedSpectralAveragesSummary(
+                    calculation_standard="NFRC",
+                    summary_values=IntegratedSpectralAveragesSummaryValues(
+                        thermal_ir=ThermalIRResults(
+                            transmittance_front_diffuse_diffuse=0.0,
+                            emissivity_front_hemispheric=0.04,
+                        )
+                    ),
+                ),
+            ],
+        )
+        # Calculated values for the standard take precedence...
+        self.assertEqual(p.get_tir_front(), 0.0)
+        self.assertEqual(p.get_emissivity_front(), 0.04)
+        # ...otherwise the predefined values are used.
+        self.assertEqual(p.get_tir_back(), "0.2")
+        self.assertEqual(p.get_emissivity_back(), "0.85")
+        self.assertEqual(p.get_tir_front("CEN"), "0.1")
+        self.assertEqual(p.get_emissivity_front("CEN"), "0.84")
+        self.assertIsNone(BaseProduct().get_tir_front())
+
     def test_has_thermal_ir_properties(self):
         wavelength_data = [
             {
@@ -0,0 +1,136 @@
+import json
+import math
+from decimal import Decimal
+from unittest import TestCase, mock
+
+from dataclasses_json import DataClassJsonMixin
+from dataclasses_json.core import _asdict, _decode_dataclass
+
+from py_igsdb_base_data import serialization
+from py_igsdb_base_data.entity import BaseEntity
+from py_igsdb_base_data.product import BaseProduct
+from py_igsdb_base_data.optical import (
+    AngleBlock,
+    OpticalProperties,
+    OpticalData,
+    IntegratedSpectralAveragesSummaryValues,
+    ThermalIRResults,
+)
+
+from tests import utils
+
+
+class TestSerialization(TestCase):
+
+    def test_dumps_extended_types(self):
+        for orjson in (serialization.orjson, None):
+            with mock.patch.object(serialization, "orjson", orjson):
+                rendered = serialization.dumps({"thickness": Decimal("3.048")})
+                self.assertEqual(json.loads(rendered), {"thickness": "3.048"})
+
+    def test_optical_properties_json_round_trip(self):
+        optical_properties = OpticalProperties(optical_data=OpticalData.from_dict(utils.sample_optical_data()))
+        for orjson in (serialization.orjson, None):
+            with mock.patch.object(serialization, "orjson", orjson):
+                json_content = optical_properties.to_json()
+                self.assertEqual(OpticalProperties.from_json(json_content), optical_properties)
+
+    def test_entity_to_json_with_json_options(self):
+        entity = BaseEntity(name="Some entity", igdb_id=1)
+        json_content = entity.to_json(indent=2)
+        self.assertIn("\n", json_content)
+        self.assertEqual(BaseEntity.from_json(json_content), entity)
+        self.assertEqual(BaseEntity.from_json(entity.to_json()), entity)
+
+    def test_native_to_json_matches_to_dict(self):
+        with open('tests/data/valid_summary_values.json', 'r') as f:
+            summary_values = IntegratedSpectralAveragesSummaryValues.from_json(f.read())
+        optical_properties = OpticalProperties(optical_data=OpticalData.from_dict(utils.sample_optical_data()))
+        for obj in (summary_values, optical_properties):
+            self.assertEqual(json.loads(obj.to_json()), obj.to_dict())
+
+    def test_nan_json_round_trip(self):
+        summary_values = IntegratedSpectralAveragesSummaryValues(
+            thermal_ir=ThermalIRResults(transmittance_front_diffuse_diffuse=float("nan"))
+        )
+        expected = DataClassJsonMixin.to_json(summary_values)
+        for orjson in (serialization.orjson, None):
+            with mock.patch.object(serialization, "orjson", orjson):
+                json_content = summary_values.to_json()
+                # Same NaN as dataclasses_json writes, not orjson's null.
+                self.assertEqual(
+                    json.loads(json_content, parse_constant=str),
+                    json.loads(expected, parse_constant=str),
+                )
+                thermal_ir = IntegratedSpectralAveragesSummaryValues.from_json(json_content).thermal_ir
+                self.assertTrue(math.isnan(thermal_ir.transmittance_front_diffuse_diffuse))
+                self.assertIn("NaN", serialization.dumps({"value": float("nan")}))
+
+    def test_to_json_big_int(self):
+        big = 2 ** 70
+        product = BaseProduct(extra_data={"x": big})
+        self.assertEqual(json.loads(product.to_json())["extra_data"], {"x": big})
+        angle_block = AngleBlock(wavelength_data=[{"w": big}])
+        self.assertEqual(json.loads(angle_block.to_json())["wavelength_data"], [{"w": big}])
+        self.assertEqual(json.loads(serialization.dumps([big])), [big])
+
+    def test_native_requires_slots(self):
+        with self.assertRaises(TypeError):
+            serialization.fast_json(BaseEntity, native=True)
+
+    def test_fast_to_dict_matches_dataclasses_json(self):
+        with open('tests/data/valid_monolithic_1.json', 'r') as f:
+            product = BaseProduct.from_json(f.read())
+        product_dict = product.to_dict()
+        expected = _asdict(product)
+        self.assertEqual(product_dict, expected)
+        self.assertEqual(list(product_dict), list(expected))
+        self.assertEqual(product.to_dict(encode_json=True), _asdict(product, encode_json=True))
+
+        # Lists and dicts are copied, not shared with the product.
+        angle_block = product.physical_properties.optical_properties.optical_data.angle_blocks[0]
+        wavelength_data = product_dict["physical_properties"]["optical_properties"]["optical_data"]["angle_blocks"][0]["wavelength_data"]
+        self.assertEqual(wavelength_data, angle_block.wavelength_data)
+        self.assertIsNot(wavelength_data, angle_block.wavelength_data)
+        self.assertIsNot(wavelength_data[0], angle_block.wavelength_data[0])
+
+    def test_product_to_json(self):
+        with open('tests/data/valid_monolithic_1.json', 'r') as f:
+            product = BaseProduct.from_json(f.read())
+        expected = json.loads(product.to_json(indent=2))  # dataclasses_json
+        for orjson in (serialization.orjson, None):
+            with mock.patch.object(serialization, "orjson", orjson):
+                json_content = product.to_json()
+                self.assertEqual(json.loads(json_content), expected)
+                self.assertEqual(BaseProduct.from_json(json_content), product)
+
+    def test_fast_from_dict_matches_dataclasses_json(self):
+        fixtures = [
+            (BaseProduct, 'tests/data/valid_monolithic_1.json'),
+            (IntegratedSpectralAveragesSummaryValues, 'tests/data/valid_summary_values.json'),
+        ]
+        for cls, path in fixtures:
+            with open(path, 'r') as f:
+                fixture_dict = json.load(f)
+            with self.subTest(path=path):
+                self.assertEqual(cls.from_dict(fixture_dict), _decode_dataclass(cls, fixture_dict, False))
+        # sample_wavelength_data.json, as the rows of an angle block.
+        optical_data_dict = utils.sample_optical_data()
+        for cls, fixture_dict in (
+            (OpticalData, optical_data_dict),
+            (OpticalProperties, {"optical_data": optical_data_dict}),
+        ):
+            with self.subTest(cls=cls.__name__):
+                self.assertEqual(cls.from_dict(fixture_dict), _decode_dataclass(cls, fixture_dict, False))
+
+        # Values are converted to the field types, e.g. ints to floats.
+        summary_values = IntegratedSpectralAveragesSummaryValues.from_dict(
+            {"thermal_ir": {"emissivity_front_hemispheric": 1}}
+        )
+        self.assertIs(type(summary_values.thermal_ir.emissivity_front_hemispheric), float)
+
+        # Missing fields without defaults.
+        with self.assertRaises(KeyError):
+            BaseEntity.from_dict({})
+        with self.assertWarns(RuntimeWarning):
+            self.assertIsNone(BaseEntity.from_dict({}, infer_missing=True).name)
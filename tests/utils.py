@@ -1,15 +1,25 @@
-import json
-
-with open("tests/data/sample_wavelength_data.json", "r") as f:
-    SAMPLE_WAVELENGTH_DATA = json.load(f)
-
-SAMPLE_OPTICAL_DATA = {
-    "number_incidence_angles": 1,
-    "angle_blocks": [
-        {
-            "incidence_angle": 0,
-            "num_wavelengths": 477,
-            "wavelength_data": SAMPLE_WAVELENGTH_DATA
-        }
-    ]
-}
\ No newline at end of file
+from functools import cache
+
+from py_igsdb_base_data.serialization import loads
+
+
+@cache
+def sample_wavelength_data() -> list:
+    # Parsed on first use, so test modules that don't need the
+    # sample data don't pay for loading it.
+    with open("tests/data/sample_wavelength_data.json", "rb") as f:
+        return loads(f.read())
+
+
+@cache
+def sample_optical_data() -> dict:
+    return {
+        "number_incidence_angles": 1,
+        "angle_blocks": [
+            {
+                "incidence_angle": 0,
+                "num_wavelengths": 477,
+                "wavelength_data": sample_wavelength_data()
+            }
+        ]
+    }